@@ -44,13 +44,16 @@ Examples:
 """
 
 import sys
+from collections import defaultdict
 from typing import List, Dict, Any
 
 from utils import (
+    is_standard_code,
     find_latest_file,
-    format_academic_year,
+    format_year_key,
+    split_year_key,
     TableFormatter,
-    read_csv_data,
+    iter_csv_columns,
     parse_positions
 )
 from config import (
@@ -67,12 +70,19 @@ from config import (
     FUNDING_OTHER,
     FUNDING_LEVY_LABEL,
     FUNDING_OTHER_LABEL,
+    OUTPUT_FORMAT_FLAGS,
     CONSOLE_PROVIDER_COLUMN_WIDTH,
     CONSOLE_YEAR_COLUMN_WIDTH
 )
 
+# Readable labels for raw funding types (unknown types are kept as-is)
+FUNDING_TYPE_LABELS = {
+    FUNDING_LEVY: 'Large employers',
+    FUNDING_OTHER: 'SMEs'
+}
 
-def extract_combined_starts(csv_file_path: str, standard_code: str = DEFAULT_STANDARD_CODE) -> List[Dict[str, Any]]:
+
+def extract_combined_starts(csv_file_path: str, standard_code: str = DEFAULT_STANDARD_CODE) -> tuple:
     """
     Extract apprenticeship starts data by region and funding type for a specific standard.
 
@@ -81,51 +91,71 @@ def extract_combined_starts(csv_file_path: str, standard_code: str = DEFAULT_STA
         standard_code: The standard code to filter for (e.g., 'ST0116')
 
     Returns:
-        List of dictionaries containing filtered combined starts data
+        Tuple of (standard_code, standard_name, starts_data) where starts_data is a
+        list of dictionaries, one per distinct (region, funding type, year, quarter)
+        group. Each record carries the summed 'starts' and the number of CSV rows
+        it represents in 'records'. standard_name is empty if no rows matched.
 
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
-        ValueError: If the CSV file has invalid format
+        ValueError: If the CSV file has invalid format or is missing a column
     """
-    def filter_by_standard(row: Dict[str, str]) -> bool:
-        """Filter for specific standard code."""
-        st_code = row.get(FIELD_ST_CODE, '').strip()
-        return st_code == standard_code
-
-    raw_data = read_csv_data(csv_file_path, filter_by_standard)
-
-    # Transform to required format
-    starts_data = []
-    for row in raw_data:
-        region = row.get(FIELD_LEARNER_HOME_REGION, '').strip()
-        funding_type = row.get(FIELD_FUNDING_TYPE, '').strip()
-        quarter_str = row.get(FIELD_START_QUARTER, '').strip()
-        quarter = parse_positions(quarter_str, default=0) if quarter_str else 0
-
-        # Map funding types to readable labels
-        if funding_type == FUNDING_LEVY:
-            funding_label = 'Large employers'
-        elif funding_type == FUNDING_OTHER:
-            funding_label = 'SMEs'
-        else:
-            funding_label = funding_type  # Keep original if unknown
-
-        starts_data.append({
-            'region': region,
-            'funding_type': funding_label,
-            'funding_type_raw': funding_type,
-            'year': row.get(FIELD_YEAR, '').strip(),
-            'quarter': quarter,
-            'starts': parse_positions(row.get(FIELD_STARTS, '').strip(), default=0),
-            'standard_code': row.get(FIELD_ST_CODE, '').strip(),
-            'standard_name': row.get(FIELD_STD_FWK_NAME_UNDERLYING, '').strip()
-        })
-
-    return starts_data
+    columns = [
+        FIELD_ST_CODE,
+        FIELD_LEARNER_HOME_REGION,
+        FIELD_FUNDING_TYPE,
+        FIELD_YEAR,
+        FIELD_START_QUARTER,
+        FIELD_STARTS,
+        FIELD_STD_FWK_NAME_UNDERLYING
+    ]
+
+    # Rows are summed into their group as they are streamed, so memory use is
+    # bounded by the number of distinct groups rather than the size of the file
+    groups = {}
+    standard_name = ''
+    # Keyed by the raw field values, so each group's key is only cleaned once
+    records_by_raw_key = {}
+    for values in iter_csv_columns(csv_file_path, columns, standard_code=standard_code,
+                                   standard_column=FIELD_ST_CODE):
+        raw_key = values[1:5]
+        record = records_by_raw_key.get(raw_key)
+
+        if record is None:
+            raw_region, raw_funding_type, raw_year, raw_quarter = raw_key
+            region = raw_region.strip()
+            funding_type = raw_funding_type.strip()
+            year = raw_year.strip()
+            quarter_str = raw_quarter.strip()
+            quarter = parse_positions(quarter_str, default=0) if quarter_str else 0
+
+            key = (region, funding_type, year, quarter)
+            record = groups.get(key)
+            if record is None:
+                # Region, funding type and year have a handful of distinct values; interning
+                # them shares one string object per value so later hashing and equality
+                # checks hit the identity fast path
+                record = groups[key] = {
+                    'region': sys.intern(region),
+                    'funding_type': sys.intern(FUNDING_TYPE_LABELS.get(funding_type, funding_type)),
+                    'year': sys.intern(year),
+                    'quarter': quarter,
+                    'starts': 0,
+                    'records': 0
+                }
+                # The name is the same on every row of a standard, so take it once
+                if not standard_name:
+                    standard_name = values[6].strip()
+            records_by_raw_key[raw_key] = record
+
+        record['starts'] += parse_positions(values[5].strip(), default=0)
+        record['records'] += 1
+
+    return (standard_code, standard_name, list(groups.values()))
 
 
 def aggregate_starts_by_region_funding_year(starts_data: List[Dict[str, Any]],
-                                             most_recent_year: str = None) -> Dict[tuple, Dict[str, int]]:
+                                             most_recent_year: str = None) -> Dict[tuple, int]:
     """
     Aggregate starts data by region, funding type, and year.
 
@@ -135,50 +165,48 @@ def aggregate_starts_by_region_funding_year(starts_data: List[Dict[str, Any]],
                           If specified, this year will be broken down by quarters.
 
     Returns:
-        Dictionary with (region, funding_type) tuples as keys and year/quarter->starts dictionaries as values.
+        Dictionary with (region, funding_type, year_key) tuples as keys and starts as values.
     """
-    aggregated = {}
+    aggregated = defaultdict(int)
+
+    # Year keys depend only on (year, quarter), so build each one once
+    year_key_cache = {}
 
     for record in starts_data:
-        region = record['region']
-        funding_type = record['funding_type']
         year = record['year']
         quarter = record['quarter']
-        starts = record['starts']
-
-        key = (region, funding_type)
-        if key not in aggregated:
-            aggregated[key] = {}
-
-        # For the most recent year, create quarterly keys
-        if most_recent_year and year == most_recent_year and quarter > 0:
-            year_key = f"{year} Q{quarter}"
-        else:
-            year_key = year
 
-        if year_key not in aggregated[key]:
-            aggregated[key][year_key] = 0
+        year_key = year_key_cache.get((year, quarter))
+        if year_key is None:
+            # For the most recent year, create quarterly keys
+            if most_recent_year and year == most_recent_year and quarter > 0:
+                year_key = f"{year} Q{quarter}"
+            else:
+                year_key = year
+            year_key_cache[(year, quarter)] = year_key
 
-        aggregated[key][year_key] += starts
+        aggregated[(record['region'], record['funding_type'], year_key)] += record['starts']
 
-    return aggregated
+    return dict(aggregated)
 
 
-def prepare_combined_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
+def prepare_combined_table_data(starts_data: List[Dict[str, Any]], standard_code: str,
+                                standard_name: str) -> tuple:
     """
     Prepare data for combined table with major regions split by funding type.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
-        Tuple of (headers, rows, title)
+        Tuple of (headers, rows, title, bold_rows) where bold_rows is the set of
+        indices of total rows that are emphasised in markdown output
     """
     if not starts_data:
-        return (['Region / Employer Size', 'No data available'], [], 'Unknown Standard')
+        return (['Region / Employer Size', 'No data available'], [], 'Unknown Standard', set())
 
-    standard_code = starts_data[0].get('standard_code', 'ST0000')
-    standard_name = starts_data[0].get('standard_name', 'Unknown Standard')
     title = f"{standard_code} {standard_name} starts by region and employer size"
 
     # Identify the most recent year
@@ -186,7 +214,7 @@ def prepare_combined_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
     sorted_base_years = sorted(all_base_years)
 
     if not sorted_base_years:
-        return (['Region / Employer Size', 'No data available'], [], standard_name)
+        return (['Region / Employer Size', 'No data available'], [], standard_name, set())
 
     most_recent_year = sorted_base_years[-1]
 
@@ -194,141 +222,107 @@ def prepare_combined_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
     aggregated = aggregate_starts_by_region_funding_year(starts_data, most_recent_year)
 
     # Get all year/quarter keys and sort them
-    all_year_keys = set()
-    for region_funding_data in aggregated.values():
-        all_year_keys.update(region_funding_data.keys())
+    all_year_keys = set(year_key for _, _, year_key in aggregated)
 
     # Sort year keys
-    def sort_key(year_key: str) -> tuple:
-        if ' Q' in year_key:
-            year_part, q_part = year_key.split(' Q')
-            return (year_part, int(q_part))
-        else:
-            return (year_key, 0)
-
-    year_keys = sorted(all_year_keys, key=sort_key)
+    year_keys = sorted(all_year_keys, key=split_year_key)
 
     if not year_keys:
-        return (['Region / Employer Size', 'No data available'], [], standard_name)
+        return (['Region / Employer Size', 'No data available'], [], standard_name, set())
 
     # Identify quarterly keys for most recent year
     quarterly_keys = [key for key in year_keys if key.startswith(most_recent_year) and ' Q' in key]
 
-    # Build final year_keys list with total column before quarterly breakdown
-    final_year_keys = []
-    for key in year_keys:
-        if ' Q' not in key:
-            final_year_keys.append(key)
-        elif key == quarterly_keys[0]:
-            final_year_keys.append(most_recent_year)
-            final_year_keys.append(key)
-        else:
-            final_year_keys.append(key)
-
-    year_keys = final_year_keys
+    # Insert the most recent year's total column before its quarterly breakdown
+    first_quarter_index = next((i for i, key in enumerate(year_keys) if ' Q' in key), None)
+    if first_quarter_index is not None:
+        year_keys = year_keys[:first_quarter_index] + [most_recent_year] + year_keys[first_quarter_index:]
 
     # Define major regions and row order
     major_regions = ['London', 'North West', 'South East']
+    major_region_set = frozenset(major_regions)
     funding_types = ['Large employers', 'SMEs']
 
     # Build rows in specified order
-    headers = ['Region / Employer Size'] + [format_academic_year(year_key.split(' Q')[0]) +
-                                            (f" Q{year_key.split(' Q')[1]}" if ' Q' in year_key else '')
-                                            for year_key in year_keys]
+    headers = ['Region / Employer Size'] + [format_year_key(year_key) for year_key in year_keys]
+    # Map each year/quarter key to its column position so rows are filled by index.
+    # Columns for the most recent year itself always show the sum of its quarters.
+    column_index = {year_key: i for i, year_key in enumerate(year_keys) if year_key != most_recent_year}
+    quarterly_columns = [column_index[q_key] for q_key in quarterly_keys]
+    recent_year_columns = [i for i, year_key in enumerate(year_keys) if year_key == most_recent_year]
+
+    # Build each (region, funding type) row once; every section below sums these
+    region_funding_values = {}
+    for (region, funding_type, year_key), starts in aggregated.items():
+        row_values = region_funding_values.get((region, funding_type))
+        if row_values is None:
+            row_values = region_funding_values[(region, funding_type)] = [0] * len(year_keys)
+        i = column_index.get(year_key)
+        if i is not None:
+            row_values[i] = starts
+
+    for row_values in region_funding_values.values():
+        recent_total = sum(row_values[i] for i in quarterly_columns)
+        for i in recent_year_columns:
+            row_values[i] = recent_total
+
+    def add_values(totals: List[int], row_values: List[int]) -> None:
+        for i, value in enumerate(row_values):
+            totals[i] += value
+
+    # Accumulate grand, per-funding and "all other regions" totals in a single pass
+    grand_total_values = [0] * len(year_keys)
+    funding_totals = {funding_type: [0] * len(year_keys) for funding_type in funding_types}
+    other_region_totals = {funding_type: [0] * len(year_keys) for funding_type in funding_types}
+
+    for (region, funding_type), row_values in region_funding_values.items():
+        add_values(grand_total_values, row_values)
+        if funding_type in funding_totals:
+            add_values(funding_totals[funding_type], row_values)
+            if region not in major_region_set:
+                add_values(other_region_totals[funding_type], row_values)
+
     rows = []
+    bold_rows = set()
 
     # Grand total row
-    grand_total_values = []
-    for year_key in year_keys:
-        if year_key == most_recent_year:
-            total = sum(
-                data.get(q_key, 0)
-                for q_key in quarterly_keys
-                for data in aggregated.values()
-            )
-        else:
-            total = sum(
-                data.get(year_key, 0)
-                for data in aggregated.values()
-            )
-        grand_total_values.append(total)
-
-    grand_total_row = ['**Grand Total**'] + [f"**{val}**" for val in grand_total_values]
+    grand_total_row = ['Grand Total'] + grand_total_values
+    bold_rows.add(len(rows))
     rows.append(grand_total_row)
 
     # Major regions broken down by funding type
     for region in major_regions:
         for funding_type in funding_types:
-            key = (region, funding_type)
-            year_data = aggregated.get(key, {})
-
-            row_values = []
-            for year_key in year_keys:
-                if year_key == most_recent_year:
-                    total_value = sum(year_data.get(q_key, 0) for q_key in quarterly_keys)
-                    row_values.append(total_value)
-                else:
-                    row_values.append(year_data.get(year_key, 0))
-
+            row_values = region_funding_values.get((region, funding_type), [0] * len(year_keys))
             row_label = f"{region} ({funding_type.lower()})"
             row = [row_label] + row_values
             rows.append(row)
 
     # All other regions broken down by funding type
     for funding_type in funding_types:
-        row_values = []
-        for year_key in year_keys:
-            if year_key == most_recent_year:
-                total = sum(
-                    data.get(q_key, 0)
-                    for q_key in quarterly_keys
-                    for (reg, fund), data in aggregated.items()
-                    if fund == funding_type and reg not in major_regions
-                )
-            else:
-                total = sum(
-                    data.get(year_key, 0)
-                    for (reg, fund), data in aggregated.items()
-                    if fund == funding_type and reg not in major_regions
-                )
-            row_values.append(total)
-
         row_label = f"All other regions ({funding_type.lower()})"
-        row = [row_label] + row_values
+        row = [row_label] + other_region_totals[funding_type]
         rows.append(row)
 
     # Total by funding type (all regions)
     for funding_type in funding_types:
-        row_values = []
-        for year_key in year_keys:
-            if year_key == most_recent_year:
-                total = sum(
-                    data.get(q_key, 0)
-                    for q_key in quarterly_keys
-                    for (reg, fund), data in aggregated.items()
-                    if fund == funding_type
-                )
-            else:
-                total = sum(
-                    data.get(year_key, 0)
-                    for (reg, fund), data in aggregated.items()
-                    if fund == funding_type
-                )
-            row_values.append(total)
-
-        row_label = f"**Total {funding_type.lower()}**"
-        row = [row_label] + [f"**{val}**" for val in row_values]
+        row_label = f"Total {funding_type.lower()}"
+        row = [row_label] + funding_totals[funding_type]
+        bold_rows.add(len(rows))
         rows.append(row)
 
-    return (headers, rows, title)
+    return (headers, rows, title, bold_rows)
 
 
-def format_combined_markdown(starts_data: List[Dict[str, Any]]) -> str:
+def format_combined_markdown(starts_data: List[Dict[str, Any]], standard_code: str,
+                             standard_name: str) -> str:
     """
     Format combined starts data as a markdown table.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         Markdown table formatted string with header
@@ -336,43 +330,43 @@ def format_combined_markdown(starts_data: List[Dict[str, Any]]) -> str:
     if not starts_data:
         return "No apprenticeship starts data found for the specified standard."
 
-    headers, rows, title = prepare_combined_table_data(starts_data)
+    headers, rows, title, bold_rows = prepare_combined_table_data(starts_data, standard_code, standard_name)
 
     output_lines = []
     output_lines.append(f"# {title}")
     output_lines.append("")
-    output_lines.append(TableFormatter.to_markdown(headers, rows))
+    output_lines.append(TableFormatter.to_markdown(headers, rows, bold_rows))
 
     return '\n'.join(output_lines)
 
 
-def format_combined_csv(starts_data: List[Dict[str, Any]]) -> str:
+def format_combined_csv(starts_data: List[Dict[str, Any]], standard_code: str,
+                        standard_name: str) -> str:
     """
     Format combined starts data as CSV.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         CSV formatted string
     """
-    headers, rows, _ = prepare_combined_table_data(starts_data)
-
-    # Remove markdown bold formatting from CSV output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    headers, rows, _, _ = prepare_combined_table_data(starts_data, standard_code, standard_name)
 
-    return TableFormatter.to_csv(headers, cleaned_rows)
+    return TableFormatter.to_csv(headers, rows)
 
 
-def format_combined_table(starts_data: List[Dict[str, Any]]) -> str:
+def format_combined_table(starts_data: List[Dict[str, Any]], standard_code: str,
+                          standard_name: str) -> str:
     """
     Format combined starts data as a console-friendly table.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         Formatted table string
@@ -380,13 +374,7 @@ def format_combined_table(starts_data: List[Dict[str, Any]]) -> str:
     if not starts_data:
         return "No apprenticeship starts data found for the specified standard."
 
-    headers, rows, title = prepare_combined_table_data(starts_data)
-
-    # Remove markdown formatting for console output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    headers, rows, title, _ = prepare_combined_table_data(starts_data, standard_code, standard_name)
 
     output_lines = []
     output_lines.append(title.upper())
@@ -398,45 +386,34 @@ def format_combined_table(starts_data: List[Dict[str, Any]]) -> str:
     for _ in range(len(headers) - 1):
         column_widths.append(CONSOLE_YEAR_COLUMN_WIDTH)
 
-    output_lines.append(TableFormatter.to_console_table(headers, cleaned_rows, column_widths))
+    output_lines.append(TableFormatter.to_console_table(headers, rows, column_widths))
 
     return '\n'.join(output_lines)
 
 
-def format_combined_tsv(starts_data: List[Dict[str, Any]]) -> str:
+def format_combined_tsv(starts_data: List[Dict[str, Any]], standard_code: str,
+                        standard_name: str) -> str:
     """
     Format combined starts data as TSV.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         TSV formatted string
     """
-    headers, rows, _ = prepare_combined_table_data(starts_data)
-
-    # Remove markdown formatting
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    headers, rows, _, _ = prepare_combined_table_data(starts_data, standard_code, standard_name)
 
-    return TableFormatter.to_tsv(headers, cleaned_rows)
+    return TableFormatter.to_tsv(headers, rows)
 
 
 def main():
     """Main function to run the combined starts extraction."""
-    # Find the most recent underlying starts file
-    default_file = find_latest_file(UNDERLYING_STARTS_FILE_PATTERN)
-
-    if not default_file:
-        print("Error: No underlying starts data files found in apprenticeships_* folders")
-        print("Please ensure you have downloaded apprenticeship data from the DfE website")
-        sys.exit(1)
-
     # Handle command line arguments
     output_format = 'markdown'  # 'markdown', 'console', 'csv', or 'tsv'
-    csv_file_path = default_file
+    csv_file_path = None
     standard_code = DEFAULT_STANDARD_CODE
 
     # Parse arguments: [options] [standard_code] [input_file]
@@ -446,18 +423,14 @@ def main():
         if arg in ['-h', '--help']:
             print(__doc__)
             return
-        elif arg in ['--csv', '-c']:
-            output_format = 'csv'
-        elif arg in ['--table']:
-            output_format = 'console'
-        elif arg in ['--tsv', '-t']:
-            output_format = 'tsv'
+        elif arg in OUTPUT_FORMAT_FLAGS:
+            output_format = OUTPUT_FORMAT_FLAGS[arg]
         elif not arg.startswith('-'):
             positional_args.append(arg)
 
     # First positional arg is standard code, second is file path
     if len(positional_args) >= 1:
-        if positional_args[0].startswith('ST') and len(positional_args[0]) >= 5:
+        if is_standard_code(positional_args[0]):
             standard_code = positional_args[0]
             if len(positional_args) >= 2:
                 csv_file_path = positional_args[1]
@@ -465,35 +438,44 @@ def main():
             # If first arg doesn't look like a standard code, treat it as a file
             csv_file_path = positional_args[0]
 
+    # Only search for the most recent underlying starts file if none was given
+    if csv_file_path is None:
+        csv_file_path = find_latest_file(UNDERLYING_STARTS_FILE_PATTERN)
+
+        if not csv_file_path:
+            print("Error: No underlying starts data files found in apprenticeships_* folders")
+            print("Please ensure you have downloaded apprenticeship data from the DfE website")
+            sys.exit(1)
+
     try:
         if output_format == 'console':
             print(f"Extracting combined regional and funding apprenticeship starts for {standard_code} from: {csv_file_path}")
             print()
 
         # Extract combined starts data
-        starts_data = extract_combined_starts(csv_file_path, standard_code)
+        standard_code, standard_name, starts_data = extract_combined_starts(csv_file_path, standard_code)
 
         # Display summary
         if output_format == 'console':
-            total_records = len(starts_data)
+            total_records = sum(record['records'] for record in starts_data)
             total_starts = sum(record['starts'] for record in starts_data)
             print(f"Found {total_records} records with {total_starts} total starts for {standard_code}")
             if starts_data:
-                print(f"Standard: {starts_data[0]['standard_name']}")
+                print(f"Standard: {standard_name}")
             print()
 
         # Display output in requested format
         if output_format == 'csv':
-            csv_output = format_combined_csv(starts_data)
+            csv_output = format_combined_csv(starts_data, standard_code, standard_name)
             print(csv_output)
         elif output_format == 'tsv':
-            tsv_output = format_combined_tsv(starts_data)
+            tsv_output = format_combined_tsv(starts_data, standard_code, standard_name)
             print(tsv_output)
         elif output_format == 'console':
-            table_output = format_combined_table(starts_data)
+            table_output = format_combined_table(starts_data, standard_code, standard_name)
             print(table_output)
         else:  # markdown
-            markdown_output = format_combined_markdown(starts_data)
+            markdown_output = format_combined_markdown(starts_data, standard_code, standard_name)
             print(markdown_output)
 
     except FileNotFoundError as e:
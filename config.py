@@ -33,6 +33,15 @@ NON_LONDON_MIN_POSITIONS = 3            # Minimum positions for non-London emplo
 # Default standard codes
 DEFAULT_STANDARD_CODE = 'ST0116'        # Software Developer Level 4
 
+# Command line flags that select an output format (markdown is the default)
+OUTPUT_FORMAT_FLAGS = {
+    '--csv': 'csv',
+    '-c': 'csv',
+    '--table': 'console',
+    '--tsv': 'tsv',
+    '-t': 'tsv'
+}
+
 # Column widths for console output
 CONSOLE_PROVIDER_COLUMN_WIDTH = 40
 CONSOLE_EMPLOYER_COLUMN_WIDTH = 40
@@ -17,6 +17,9 @@ Options:
     --csv, -c       Output in CSV format (suitable for importing into databases)
     --table         Output in table format (console-friendly aligned tables)
     --tsv, -t       Output in tab-separated format (for copy-paste into spreadsheets)
+    --cache         Reuse a cached extract of the CSV file if it is unchanged
+    --all           Output a table for every standard in the file (reads it once);
+                    cannot be combined with a standard_code or --cache
     --help, -h      Show this help message
 
 Arguments:
@@ -28,22 +31,32 @@ Output:
     Shows funding type breakdown (levy vs non-levy) by year
     Includes a total row showing all starts across all funding types by year
     Most recent year shows quarterly breakdown only if Q4 is not yet available (2024-25 Q1, 2024-25 Q2, etc.)
+    With --cache, the extract for each (file, standard) is kept in
+    ~/.cache/apprenticeship-funding (or $XDG_CACHE_HOME/apprenticeship-funding)
+    and reused until the input file changes; extracts of older versions are pruned
 
 Examples:
     python3 funding.py                       # ST0116, latest file with quarterly breakdown
     python3 funding.py ST0113                # ST0113, latest file with quarterly breakdown
     python3 funding.py ST0116 data.csv       # ST0116, specific file
     python3 funding.py --csv ST0113          # ST0113, CSV format
+    python3 funding.py --all                 # Every standard, latest file
 """
 
+import hashlib
+import json
+import os
 import sys
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import List, Dict, Any, Iterable
 
 from utils import (
+    is_standard_code,
     find_latest_file,
-    format_academic_year,
+    format_year_key,
+    split_year_key,
     TableFormatter,
-    read_csv_data,
+    iter_csv_columns,
     parse_positions
 )
 from config import (
@@ -59,12 +72,50 @@ from config import (
     FUNDING_OTHER,
     FUNDING_LEVY_LABEL,
     FUNDING_OTHER_LABEL,
+    OUTPUT_FORMAT_FLAGS,
     CONSOLE_PROVIDER_COLUMN_WIDTH,
     CONSOLE_YEAR_COLUMN_WIDTH
 )
 
+# Readable labels for raw funding types (unknown types are kept as-is)
+FUNDING_TYPE_LABELS = {
+    FUNDING_LEVY: FUNDING_LEVY_LABEL,
+    FUNDING_OTHER: FUNDING_OTHER_LABEL
+}
 
-def extract_funding_starts(csv_file_path: str, standard_code: str = DEFAULT_STANDARD_CODE) -> List[Dict[str, Any]]:
+# Row order of the known funding type labels; any other labels follow alphabetically
+FUNDING_TYPE_ORDER = {FUNDING_LEVY_LABEL: 0, FUNDING_OTHER_LABEL: 1}
+
+# Columns read from the underlying starts file, in the order rows are unpacked
+FUNDING_COLUMNS = [
+    FIELD_ST_CODE,
+    FIELD_FUNDING_TYPE,
+    FIELD_YEAR,
+    FIELD_START_QUARTER,
+    FIELD_STARTS,
+    FIELD_STD_FWK_NAME_UNDERLYING
+]
+
+# Bump when the shape of extracted records changes so stale cache files are ignored
+FUNDING_CACHE_VERSION = 2
+
+# Per-user directory for --cache extracts, so no other user can plant or prune them
+FUNDING_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'apprenticeship-funding'
+)
+
+# Field types of a cached funding record, checked before a cache hit is trusted
+FUNDING_RECORD_TYPES = {
+    'funding_type': str,
+    'year': str,
+    'quarter': int,
+    'starts': int,
+    'records': int
+}
+
+
+def extract_funding_starts(csv_file_path: str, standard_code: str = DEFAULT_STANDARD_CODE) -> tuple:
     """
     Extract apprenticeship starts data by funding type for a specific standard.
 
@@ -73,49 +124,251 @@ def extract_funding_starts(csv_file_path: str, standard_code: str = DEFAULT_STAN
         standard_code: The standard code to filter for (e.g., 'ST0116')
 
     Returns:
-        List of dictionaries containing filtered funding starts data
+        Tuple of (standard_code, standard_name, starts_data) where starts_data is a
+        list of dictionaries, one per distinct (funding type, year, quarter) group.
+        Each record carries the summed 'starts' and the number of CSV rows it
+        represents in 'records'. standard_name is empty if no rows matched.
 
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
-        ValueError: If the CSV file has invalid format
+        ValueError: If the CSV file has invalid format or is missing a column
     """
-    def filter_by_standard(row: Dict[str, str]) -> bool:
-        """Filter for specific standard code."""
-        st_code = row.get(FIELD_ST_CODE, '').strip()
-        return st_code == standard_code
-
-    raw_data = read_csv_data(csv_file_path, filter_by_standard)
-
-    # Transform to required format
-    starts_data = []
-    for row in raw_data:
-        funding_type = row.get(FIELD_FUNDING_TYPE, '').strip()
-        quarter_str = row.get(FIELD_START_QUARTER, '').strip()
-        quarter = parse_positions(quarter_str, default=0) if quarter_str else 0
-
-        # Map funding types to readable labels
-        if funding_type == FUNDING_LEVY:
-            funding_label = FUNDING_LEVY_LABEL
-        elif funding_type == FUNDING_OTHER:
-            funding_label = FUNDING_OTHER_LABEL
-        else:
-            funding_label = funding_type  # Keep original if unknown
+    rows = iter_csv_columns(csv_file_path, FUNDING_COLUMNS, standard_code=standard_code,
+                            standard_column=FIELD_ST_CODE)
+    standards = summarise_funding_rows(rows)
+
+    return standards.get(standard_code, (standard_code, '', []))
+
+
+def extract_all_funding_starts(csv_file_path: str) -> Dict[str, tuple]:
+    """
+    Extract apprenticeship starts data by funding type for every standard in one pass.
+
+    Args:
+        csv_file_path: Path to the underlying CSV file containing starts data
+
+    Returns:
+        Dictionary with standard codes as keys and (standard_code, standard_name,
+        starts_data) tuples, as returned by extract_funding_starts, as values
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If the CSV file has invalid format or is missing a column
+    """
+    def has_standard_code(values: tuple) -> bool:
+        """Skip rows without a standard code."""
+        return bool(values[0].strip())
+
+    rows = iter_csv_columns(csv_file_path, FUNDING_COLUMNS, has_standard_code)
+    return summarise_funding_rows(rows)
+
+
+def summarise_funding_rows(rows: Iterable[tuple]) -> Dict[str, tuple]:
+    """
+    Sum funding starts rows into one record per (funding type, year, quarter) for each standard.
+
+    Args:
+        rows: Tuples of FUNDING_COLUMNS values, as yielded by iter_csv_columns
+
+    Returns:
+        Dictionary with standard codes as keys and (standard_code, standard_name,
+        starts_data) tuples as values
+    """
+    # Standard code -> [standard_name, groups]. Rows are summed into their group as
+    # they are streamed, so memory use is bounded by the number of distinct groups
+    # rather than the size of the file
+    standards = {}
+    # Raw field values -> group record, so a group's key is only parsed once
+    records_by_raw_key = {}
+    # Starts and quarter cells repeat a small set of values, so each distinct raw
+    # value is parsed once and its count looked up afterwards
+    parsed_counts = {}
+    for raw_st_code, raw_funding_type, raw_year, raw_quarter, starts, raw_standard_name in rows:
+        raw_key = (raw_st_code, raw_funding_type, raw_year, raw_quarter)
+        record = records_by_raw_key.get(raw_key)
+
+        if record is None:
+            st_code = raw_st_code.strip()
+            funding_type = raw_funding_type.strip()
+            year = raw_year.strip()
+            quarter = parsed_counts.get(raw_quarter)
+            if quarter is None:
+                quarter = parsed_counts[raw_quarter] = parse_positions(raw_quarter, default=0)
+
+            standard = standards.get(st_code)
+            if standard is None:
+                # The name is the same on every row of a standard, so take it once
+                standard = standards[st_code] = [raw_standard_name.strip(), {}]
+            groups = standard[1]
+
+            key = (funding_type, year, quarter)
+            record = groups.get(key)
+            if record is None:
+                # Funding type and year have a handful of distinct values; interning
+                # them shares one string object per value so later hashing and equality
+                # checks hit the identity fast path
+                record = groups[key] = {
+                    'funding_type': sys.intern(FUNDING_TYPE_LABELS.get(funding_type, funding_type)),
+                    'year': sys.intern(year),
+                    'quarter': quarter,
+                    'starts': 0,
+                    'records': 0
+                }
+            records_by_raw_key[raw_key] = record
+
+        starts_count = parsed_counts.get(starts)
+        if starts_count is None:
+            starts_count = parsed_counts[starts] = parse_positions(starts, default=0)
+
+        record['starts'] += starts_count
+        record['records'] += 1
+
+    return {
+        st_code: (st_code, standard_name, list(groups.values()))
+        for st_code, (standard_name, groups) in standards.items()
+    }
+
+
+def _cache_digest(text: str) -> str:
+    """Short hex digest used in cache file names."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def get_funding_cache_path(csv_file_path: str, standard_code: str,
+                           cache_dir: str = FUNDING_CACHE_DIR) -> str:
+    """
+    Get the cache file path for a funding extract.
+
+    The name is '<path digest>_<state digest>_<standard digest>.json'. The state
+    digest covers the file's size and modification time, so editing or replacing
+    the CSV file produces a new name, and older extracts of the same path can be
+    found by their shared path digest prefix.
+
+    Args:
+        csv_file_path: Path to the underlying CSV file containing starts data
+        standard_code: The standard code the extract is for
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        Path of the JSON cache file in cache_dir
+
+    Raises:
+        OSError: If the CSV file cannot be accessed
+    """
+    stat = os.stat(csv_file_path)
+    path_key = _cache_digest(os.path.abspath(csv_file_path))
+    state_key = _cache_digest(f"{FUNDING_CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}")
+    standard_key = _cache_digest(standard_code)
+    return os.path.join(cache_dir, f"{path_key}_{state_key}_{standard_key}.json")
+
+
+def prune_funding_cache(cache_path: str) -> None:
+    """
+    Remove cache files for the same CSV path whose file state no longer matches.
+
+    Args:
+        cache_path: Current cache file path, as returned by get_funding_cache_path
+    """
+    cache_dir, cache_name = os.path.split(cache_path)
+    path_key, state_key, _ = cache_name.split('_', 2)
+    current_prefix = f"{path_key}_{state_key}_"
+
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+
+    for name in names:
+        if name.startswith(f"{path_key}_") and not name.startswith(current_prefix):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def is_valid_funding_extract(extract: Any, standard_code: str) -> bool:
+    """
+    Check that a cached extract has the shape returned by extract_funding_starts.
+
+    Args:
+        extract: Value loaded from a cache file
+        standard_code: The standard code the extract should be for
+
+    Returns:
+        True if extract is a (standard_code, standard_name, starts_data) triple
+        whose records have the expected fields and types
+    """
+    if not isinstance(extract, list) or len(extract) != 3:
+        return False
+    cached_code, standard_name, starts_data = extract
+    if cached_code != standard_code or not isinstance(standard_name, str):
+        return False
+    if not isinstance(starts_data, list):
+        return False
+    return all(
+        isinstance(record, dict) and len(record) == len(FUNDING_RECORD_TYPES) and all(
+            isinstance(record.get(field), field_type)
+            for field, field_type in FUNDING_RECORD_TYPES.items()
+        )
+        for record in starts_data
+    )
+
+
+def extract_funding_starts_cached(csv_file_path: str,
+                                  standard_code: str = DEFAULT_STANDARD_CODE,
+                                  cache_dir: str = FUNDING_CACHE_DIR) -> tuple:
+    """
+    Extract funding starts data, reusing a cached extract if the file is unchanged.
+
+    Caching is best-effort: an unreadable, malformed or unwritable cache falls
+    back to extracting from the CSV file. Extracts of older versions of the same file
+    are pruned whenever a new extract is written.
+
+    Args:
+        csv_file_path: Path to the underlying CSV file containing starts data
+        standard_code: The standard code to filter for (e.g., 'ST0116')
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        Tuple of (standard_code, standard_name, starts_data) as returned by
+        extract_funding_starts
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If the CSV file has invalid format or is missing a column
+    """
+    try:
+        cache_path = get_funding_cache_path(csv_file_path, standard_code, cache_dir)
+    except OSError:
+        # Let extract_funding_starts report the missing or unreadable file
+        return extract_funding_starts(csv_file_path, standard_code)
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            cached = json.load(cache_file)
+        if is_valid_funding_extract(cached, standard_code):
+            return tuple(cached)
+    except (OSError, ValueError):
+        pass
 
-        starts_data.append({
-            'funding_type': funding_label,
-            'funding_type_raw': funding_type,
-            'year': row.get(FIELD_YEAR, '').strip(),
-            'quarter': quarter,
-            'starts': parse_positions(row.get(FIELD_STARTS, '').strip(), default=0),
-            'standard_code': row.get(FIELD_ST_CODE, '').strip(),
-            'standard_name': row.get(FIELD_STD_FWK_NAME_UNDERLYING, '').strip()
-        })
+    extract = extract_funding_starts(csv_file_path, standard_code)
 
-    return starts_data
+    # Write to a temporary name first so a concurrent run never reads a partial file
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        prune_funding_cache(cache_path)
+        with open(temp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(extract, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+    return extract
 
 
 def aggregate_starts_by_funding_year(starts_data: List[Dict[str, Any]],
-                                      most_recent_year: str = None) -> Dict[str, Dict[str, int]]:
+                                      most_recent_year: str = None) -> Dict[tuple, int]:
     """
     Aggregate starts data by funding type and year, with optional quarterly breakdown for most recent year.
 
@@ -126,36 +379,35 @@ def aggregate_starts_by_funding_year(starts_data: List[Dict[str, Any]],
                           If None, all years including the most recent will be shown as annual totals.
 
     Returns:
-        Dictionary with funding type labels as keys and year/quarter->starts dictionaries as values.
-        If most_recent_year is specified, keys for that year will be like '2024-25 Q1', '2024-25 Q2', etc.
-        For other years (or all years if most_recent_year is None), keys will be just the year like '2023-24'.
+        Dictionary with (funding type label, year_key) tuples as keys and starts as values.
+        If most_recent_year is specified, year keys for that year will be like '2024-25 Q1', '2024-25 Q2', etc.
+        For other years (or all years if most_recent_year is None), year keys will be just the year like '2023-24'.
     """
-    aggregated = {}
+    aggregated = defaultdict(int)
+
+    # Year keys depend only on (year, quarter), so build each one once
+    year_key_cache = {}
 
     for record in starts_data:
-        funding_type = record['funding_type']
         year = record['year']
         quarter = record['quarter']
-        starts = record['starts']
-
-        if funding_type not in aggregated:
-            aggregated[funding_type] = {}
 
-        # For the most recent year, create quarterly keys
-        if most_recent_year and year == most_recent_year and quarter > 0:
-            year_key = f"{year} Q{quarter}"
-        else:
-            year_key = year
-
-        if year_key not in aggregated[funding_type]:
-            aggregated[funding_type][year_key] = 0
+        year_key = year_key_cache.get((year, quarter))
+        if year_key is None:
+            # For the most recent year, create quarterly keys
+            if most_recent_year and year == most_recent_year and quarter > 0:
+                year_key = f"{year} Q{quarter}"
+            else:
+                year_key = year
+            year_key_cache[(year, quarter)] = year_key
 
-        aggregated[funding_type][year_key] += starts
+        aggregated[(record['funding_type'], year_key)] += record['starts']
 
-    return aggregated
+    return dict(aggregated)
 
 
-def prepare_funding_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
+def prepare_funding_table_data(starts_data: List[Dict[str, Any]], standard_code: str,
+                               standard_name: str) -> tuple:
     """
     Prepare data for funding starts table formatting with conditional quarterly breakdown for most recent year.
 
@@ -164,15 +416,16 @@ def prepare_funding_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
-        Tuple of (headers, rows, title)
+        Tuple of (headers, rows, title, bold_rows) where bold_rows is the set of
+        indices of total rows that are emphasised in markdown output
     """
     if not starts_data:
-        return (['Funding Type', 'No data available'], [], 'Unknown Standard')
+        return (['Funding Type', 'No data available'], [], 'Unknown Standard', set())
 
-    standard_code = starts_data[0].get('standard_code', 'ST0000')
-    standard_name = starts_data[0].get('standard_name', 'Unknown Standard')
     title = f"{standard_code} {standard_name} starts by employer size (funding type)"
 
     # First, identify the most recent year (without quarters)
@@ -180,7 +433,7 @@ def prepare_funding_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
     sorted_base_years = sorted(all_base_years)
 
     if not sorted_base_years:
-        return (['Funding Type', 'No data available'], [], standard_name)
+        return (['Funding Type', 'No data available'], [], standard_name, set())
 
     most_recent_year = sorted_base_years[-1]
 
@@ -198,24 +451,13 @@ def prepare_funding_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
     aggregated = aggregate_starts_by_funding_year(starts_data, year_for_quarterly_breakdown)
 
     # Get all year/quarter keys and sort them
-    all_year_keys = set()
-    for funding_data in aggregated.values():
-        all_year_keys.update(funding_data.keys())
+    all_year_keys = set(year_key for _, year_key in aggregated)
 
     # Sort year keys: regular years first, then quarterly keys
-    def sort_key(year_key: str) -> tuple:
-        if ' Q' in year_key:
-            # Quarterly key like "2024-25 Q1"
-            year_part, q_part = year_key.split(' Q')
-            return (year_part, int(q_part))
-        else:
-            # Regular year like "2023-24"
-            return (year_key, 0)
-
-    year_keys = sorted(all_year_keys, key=sort_key)
+    year_keys = sorted(all_year_keys, key=split_year_key)
 
     if not year_keys:
-        return (['Funding Type', 'No data available'], [], standard_name)
+        return (['Funding Type', 'No data available'], [], standard_name, set())
 
     # Identify quarterly keys for most recent year
     quarterly_keys = [key for key in year_keys if key.startswith(most_recent_year) and ' Q' in key]
@@ -236,60 +478,59 @@ def prepare_funding_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
         year_keys = final_year_keys
     # If no quarterly breakdown, year_keys is already correct
 
-    # Calculate totals for each year/quarter key
-    year_totals = {}
-    for year_key in year_keys:
-        if quarterly_keys and year_key == most_recent_year:
-            # For the total column, sum all quarterly data
-            year_totals[year_key] = sum(
-                funding_data.get(q_key, 0)
-                for q_key in quarterly_keys
-                for _, funding_data in aggregated.items()
-            )
-        else:
-            year_totals[year_key] = sum(
-                funding_data.get(year_key, 0)
-                for _, funding_data in aggregated.items()
-            )
-
     # Sort funding types: levy first, then others
-    funding_types = sorted(aggregated.keys(), key=lambda x: (
-        0 if x == FUNDING_LEVY_LABEL else 1 if x == FUNDING_OTHER_LABEL else 2,
-        x
-    ))
+    funding_types = sorted(set(funding_type for funding_type, _ in aggregated),
+                           key=lambda x: (FUNDING_TYPE_ORDER.get(x, 2), x))
+
+    # Map each year/quarter key to its column position so rows are filled by index.
+    # With a quarterly breakdown, the most recent year's total column is the sum of its quarters.
+    column_index = {year_key: i for i, year_key in enumerate(year_keys)
+                    if not (quarterly_keys and year_key == most_recent_year)}
+    quarterly_columns = [column_index[q_key] for q_key in quarterly_keys]
+    recent_year_columns = [i for i, year_key in enumerate(year_keys)
+                           if quarterly_keys and year_key == most_recent_year]
+
+    funding_row_values = {funding_type: [0] * len(year_keys) for funding_type in funding_types}
+    for (funding_type, year_key), starts in aggregated.items():
+        i = column_index.get(year_key)
+        if i is not None:
+            funding_row_values[funding_type][i] = starts
+
+    # Fill the total columns, accumulating the total row as we go
+    total_values = [0] * len(year_keys)
+    for row_values in funding_row_values.values():
+        recent_total = sum(row_values[i] for i in quarterly_columns)
+        for i in recent_year_columns:
+            row_values[i] = recent_total
+        for i, value in enumerate(row_values):
+            total_values[i] += value
 
     # Build table data
-    headers = ['Funding Type'] + [format_academic_year(year_key.split(' Q')[0]) + (f" Q{year_key.split(' Q')[1]}" if ' Q' in year_key else '')
-                                   for year_key in year_keys]
+    headers = ['Funding Type'] + [format_year_key(year_key) for year_key in year_keys]
     rows = []
 
     # Total row
-    total_row = ['**Total**'] + [f"**{year_totals.get(year_key, 0)}**" for year_key in year_keys]
+    total_row = ['Total'] + total_values
+    bold_rows = {len(rows)}
     rows.append(total_row)
 
     # Funding type rows
     for funding_type in funding_types:
-        year_data = aggregated[funding_type]
-        row_values = []
-        for year_key in year_keys:
-            if quarterly_keys and year_key == most_recent_year:
-                # For the total column, sum all quarterly data for this funding type
-                total_value = sum(year_data.get(q_key, 0) for q_key in quarterly_keys)
-                row_values.append(total_value)
-            else:
-                row_values.append(year_data.get(year_key, 0))
-        row = [funding_type] + row_values
+        row = [funding_type] + funding_row_values[funding_type]
         rows.append(row)
 
-    return (headers, rows, title)
+    return (headers, rows, title, bold_rows)
 
 
-def format_funding_markdown(starts_data: List[Dict[str, Any]]) -> str:
+def format_funding_markdown(starts_data: List[Dict[str, Any]], standard_code: str,
+                            standard_name: str) -> str:
     """
     Format funding starts data as a markdown table with years as columns and funding types as rows.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         Markdown table formatted string with header
@@ -297,43 +538,38 @@ def format_funding_markdown(starts_data: List[Dict[str, Any]]) -> str:
     if not starts_data:
         return "No apprenticeship starts data found for the specified standard."
 
-    headers, rows, title = prepare_funding_table_data(starts_data)
-
-    output_lines = []
-    output_lines.append(f"# {title}")
-    output_lines.append("")
-    output_lines.append(TableFormatter.to_markdown(headers, rows))
+    headers, rows, title, bold_rows = prepare_funding_table_data(starts_data, standard_code, standard_name)
 
-    return '\n'.join(output_lines)
+    return f"# {title}\n\n{TableFormatter.to_markdown(headers, rows, bold_rows)}"
 
 
-def format_funding_csv(starts_data: List[Dict[str, Any]]) -> str:
+def format_funding_csv(starts_data: List[Dict[str, Any]], standard_code: str,
+                       standard_name: str) -> str:
     """
     Format funding starts data as CSV.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         CSV formatted string
     """
-    headers, rows, _ = prepare_funding_table_data(starts_data)
+    headers, rows, _, _ = prepare_funding_table_data(starts_data, standard_code, standard_name)
 
-    # Remove markdown bold formatting from CSV output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    return TableFormatter.to_csv(headers, rows)
 
-    return TableFormatter.to_csv(headers, cleaned_rows)
 
-
-def format_funding_table(starts_data: List[Dict[str, Any]]) -> str:
+def format_funding_table(starts_data: List[Dict[str, Any]], standard_code: str,
+                         standard_name: str) -> str:
     """
     Format funding starts data as a console-friendly table.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         Formatted table string
@@ -341,64 +577,41 @@ def format_funding_table(starts_data: List[Dict[str, Any]]) -> str:
     if not starts_data:
         return "No apprenticeship starts data found for the specified standard."
 
-    headers, rows, title = prepare_funding_table_data(starts_data)
-
-    # Remove markdown formatting for console output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
-
-    output_lines = []
-    output_lines.append(title.upper())
-    output_lines.append("=" * 80)
-    output_lines.append("")
+    headers, rows, title, _ = prepare_funding_table_data(starts_data, standard_code, standard_name)
 
     # Calculate column widths
-    column_widths = [CONSOLE_PROVIDER_COLUMN_WIDTH]
-    for _ in range(len(headers) - 1):
-        column_widths.append(CONSOLE_YEAR_COLUMN_WIDTH)
-
-    output_lines.append(TableFormatter.to_console_table(headers, cleaned_rows, column_widths))
+    column_widths = [CONSOLE_PROVIDER_COLUMN_WIDTH] + [CONSOLE_YEAR_COLUMN_WIDTH] * (len(headers) - 1)
 
-    return '\n'.join(output_lines)
+    table = TableFormatter.to_console_table(headers, rows, column_widths)
+    return f"{title.upper()}\n{'=' * 80}\n\n{table}"
 
 
-def format_funding_tsv(starts_data: List[Dict[str, Any]]) -> str:
+def format_funding_tsv(starts_data: List[Dict[str, Any]], standard_code: str,
+                       standard_name: str) -> str:
     """
     Format funding starts data as TSV.
 
     Args:
         starts_data: List of starts data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard's name as given in the CSV file
 
     Returns:
         TSV formatted string
     """
-    headers, rows, _ = prepare_funding_table_data(starts_data)
-
-    # Remove markdown formatting
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    headers, rows, _, _ = prepare_funding_table_data(starts_data, standard_code, standard_name)
 
-    return TableFormatter.to_tsv(headers, cleaned_rows)
+    return TableFormatter.to_tsv(headers, rows)
 
 
 def main():
     """Main function to run the funding starts extraction."""
-    # Find the most recent underlying starts file
-    default_file = find_latest_file(UNDERLYING_STARTS_FILE_PATTERN)
-
-    if not default_file:
-        print("Error: No underlying starts data files found in apprenticeships_* folders")
-        print("Please ensure you have downloaded apprenticeship data from the DfE website")
-        sys.exit(1)
-
     # Handle command line arguments
     output_format = 'markdown'  # 'markdown', 'console', 'csv', or 'tsv'
-    csv_file_path = default_file
-    standard_code = DEFAULT_STANDARD_CODE
+    csv_file_path = None
+    standard_code = None
+    use_cache = False
+    all_standards = False
 
     # Parse arguments: [options] [standard_code] [input_file]
     positional_args = []
@@ -407,18 +620,18 @@ def main():
         if arg in ['-h', '--help']:
             print(__doc__)
             return
-        elif arg in ['--csv', '-c']:
-            output_format = 'csv'
-        elif arg in ['--table']:
-            output_format = 'console'
-        elif arg in ['--tsv', '-t']:
-            output_format = 'tsv'
+        elif arg in OUTPUT_FORMAT_FLAGS:
+            output_format = OUTPUT_FORMAT_FLAGS[arg]
+        elif arg == '--cache':
+            use_cache = True
+        elif arg == '--all':
+            all_standards = True
         elif not arg.startswith('-'):
             positional_args.append(arg)
 
     # First positional arg is standard code, second is file path
     if len(positional_args) >= 1:
-        if positional_args[0].startswith('ST') and len(positional_args[0]) >= 5:
+        if is_standard_code(positional_args[0]):
             standard_code = positional_args[0]
             if len(positional_args) >= 2:
                 csv_file_path = positional_args[1]
@@ -426,36 +639,75 @@ def main():
             # If first arg doesn't look like a standard code, treat it as a file
             csv_file_path = positional_args[0]
 
+    if all_standards and standard_code is not None:
+        print(f"Error: --all cannot be combined with a standard code ({standard_code})")
+        print("Usage: python3 funding.py --all [options] [input_file]")
+        sys.exit(1)
+
+    if all_standards and use_cache:
+        print("Error: --all cannot be combined with --cache")
+        print("Usage: python3 funding.py --all [options] [input_file]")
+        sys.exit(1)
+
+    if standard_code is None:
+        standard_code = DEFAULT_STANDARD_CODE
+
+    # Only search for the most recent underlying starts file if none was given
+    if csv_file_path is None:
+        csv_file_path = find_latest_file(UNDERLYING_STARTS_FILE_PATTERN)
+
+        if not csv_file_path:
+            print("Error: No underlying starts data files found in apprenticeships_* folders")
+            print("Please ensure you have downloaded apprenticeship data from the DfE website")
+            sys.exit(1)
+
+    formatters = {
+        'csv': format_funding_csv,
+        'tsv': format_funding_tsv,
+        'console': format_funding_table,
+        'markdown': format_funding_markdown
+    }
+
     try:
+        if all_standards:
+            if output_format == 'console':
+                print(f"Extracting funding type apprenticeship starts for all standards from: {csv_file_path}")
+                print()
+
+            standards = extract_all_funding_starts(csv_file_path)
+
+            if output_format == 'console':
+                print(f"Found {len(standards)} standards")
+                print()
+
+            formatter = formatters[output_format]
+            print('\n\n'.join(
+                formatter(starts_data, code, name)
+                for code, name, starts_data in (standards[key] for key in sorted(standards))
+            ))
+            return
+
         if output_format == 'console':
             print(f"Extracting funding type apprenticeship starts for {standard_code} from: {csv_file_path}")
             print()
 
         # Extract funding starts data
-        starts_data = extract_funding_starts(csv_file_path, standard_code)
+        if use_cache:
+            standard_code, standard_name, starts_data = extract_funding_starts_cached(csv_file_path, standard_code)
+        else:
+            standard_code, standard_name, starts_data = extract_funding_starts(csv_file_path, standard_code)
 
         # Display summary
         if output_format == 'console':
-            total_records = len(starts_data)
+            total_records = sum(record['records'] for record in starts_data)
             total_starts = sum(record['starts'] for record in starts_data)
             print(f"Found {total_records} records with {total_starts} total starts for {standard_code}")
             if starts_data:
-                print(f"Standard: {starts_data[0]['standard_name']}")
+                print(f"Standard: {standard_name}")
             print()
 
         # Display output in requested format
-        if output_format == 'csv':
-            csv_output = format_funding_csv(starts_data)
-            print(csv_output)
-        elif output_format == 'tsv':
-            tsv_output = format_funding_tsv(starts_data)
-            print(tsv_output)
-        elif output_format == 'console':
-            table_output = format_funding_table(starts_data)
-            print(table_output)
-        else:  # markdown
-            markdown_output = format_funding_markdown(starts_data)
-            print(markdown_output)
+        print(formatters[output_format](starts_data, standard_code, standard_name))
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -36,16 +36,21 @@ Examples:
     python3 london_sme.py --csv                 # ST0116, CSV format
 """
 
+import itertools
 import sys
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import List, Dict, Any, Set
 
 from utils import (
     clean_provider_name,
     parse_positions,
+    is_standard_code,
     find_latest_file,
-    format_academic_year,
+    format_year_key,
+    split_year_key,
     TableFormatter,
-    read_csv_data
+    iter_csv_columns,
+    field_equals
 )
 from config import (
     UNDERLYING_STARTS_FILE_PATTERN,
@@ -59,10 +64,15 @@ from config import (
     FIELD_LEARNER_HOME_REGION,
     FIELD_FUNDING_TYPE,
     FUNDING_OTHER,
+    OUTPUT_FORMAT_FLAGS,
     CONSOLE_PROVIDER_COLUMN_WIDTH,
     CONSOLE_YEAR_COLUMN_WIDTH
 )
 
+# Rogue/closed providers, listed in this order below the total row and excluded from totals
+ROGUE_PROVIDER_NAMES = ['LONDON COLLEGE OF GLOBAL EDUCATION', 'CITY COLLEGE OF LONDON']
+ROGUE_PROVIDER_SET = frozenset(ROGUE_PROVIDER_NAMES)
+
 
 def extract_london_sme_starts(csv_file_path: str,
                               standard_code: str = DEFAULT_STANDARD_CODE) -> List[Dict[str, Any]]:
@@ -74,57 +84,88 @@ def extract_london_sme_starts(csv_file_path: str,
         standard_code: The standard code to filter for (e.g., 'ST0116')
 
     Returns:
-        List of dictionaries containing filtered starts data
+        List of dictionaries containing London SME starts data, one per distinct
+        (cleaned provider name, year, quarter) group. Each record carries the summed
+        'starts' and the number of CSV rows it represents in 'records'.
 
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
-        ValueError: If the CSV file has invalid format
+        ValueError: If the CSV file has invalid format or is missing a column
     """
-    def filter_london_sme(row: Dict[str, str]) -> bool:
-        """Filter for specific standard code, London region, and SME funding."""
-        st_code = row.get(FIELD_ST_CODE, '').strip()
-        if st_code != standard_code:
-            return False
-
-        # Check if learner home region is London
-        region = row.get(FIELD_LEARNER_HOME_REGION, '').strip()
-        if region != 'London':
-            return False
-
-        # Check if funding type is SME (Other)
-        funding_type = row.get(FIELD_FUNDING_TYPE, '').strip()
-        if funding_type != FUNDING_OTHER:
-            return False
-
-        return True
-
-    raw_data = read_csv_data(csv_file_path, filter_london_sme)
-
-    # Transform to required format
-    starts_data = []
-    for row in raw_data:
-        provider_name = row.get(FIELD_PROVIDER_NAME, '').strip()
-        quarter_str = row.get(FIELD_START_QUARTER, '').strip()
-        quarter = parse_positions(quarter_str, default=0) if quarter_str else 0
-
-        starts_data.append({
-            'provider': provider_name,
-            'provider_clean': clean_provider_name(provider_name),
-            'year': row.get(FIELD_YEAR, '').strip(),
-            'quarter': quarter,
-            'starts': parse_positions(row.get(FIELD_STARTS, '').strip(), default=0),
-            'standard_code': row.get(FIELD_ST_CODE, '').strip(),
-            'standard_name': row.get(FIELD_STD_FWK_NAME_UNDERLYING, '').strip()
-        })
-
-    return starts_data
+    def filter_london_sme(values: tuple) -> bool:
+        """Filter for London region and SME funding."""
+        return field_equals(values[1], 'London') and field_equals(values[2], FUNDING_OTHER)
+
+    columns = [
+        FIELD_ST_CODE,
+        FIELD_LEARNER_HOME_REGION,
+        FIELD_FUNDING_TYPE,
+        FIELD_PROVIDER_NAME,
+        FIELD_YEAR,
+        FIELD_START_QUARTER,
+        FIELD_STARTS,
+        FIELD_STD_FWK_NAME_UNDERLYING
+    ]
+
+    # Rows are summed into their group as they are streamed, so memory use is
+    # bounded by the number of distinct groups rather than the size of the file
+    groups = {}
+    # Keyed by the raw field values, so each group's key is only cleaned once
+    records_by_raw_key = {}
+    # Provider names repeat across many rows, so each raw name is cleaned once
+    clean_names = {}
+    # Starts and quarter cells repeat a small set of values, so each distinct raw
+    # value is parsed once and its count looked up afterwards
+    parsed_counts = {}
+    # Only the columns used below are read, as plain tuples rather than per-row dicts
+    for values in iter_csv_columns(csv_file_path, columns, filter_london_sme,
+                                   standard_code=standard_code, standard_column=FIELD_ST_CODE):
+        raw_key = values[3:6]
+        record = records_by_raw_key.get(raw_key)
+
+        if record is None:
+            st_code, _, _, provider_name, year, quarter_str, _, standard_name = values
+            provider_clean = clean_names.get(provider_name)
+            if provider_clean is None:
+                provider_clean = clean_names[provider_name] = clean_provider_name(provider_name.strip())
+            year = year.strip()
+            quarter = parsed_counts.get(quarter_str)
+            if quarter is None:
+                quarter = parsed_counts[quarter_str] = parse_positions(quarter_str, default=0)
+
+            key = (provider_clean, year, quarter)
+            record = groups.get(key)
+            if record is None:
+                record = groups[key] = {
+                    'provider_clean': provider_clean,
+                    'year': year,
+                    'quarter': quarter,
+                    'starts': 0,
+                    'records': 0,
+                    'standard_code': st_code.strip(),
+                    'standard_name': standard_name.strip()
+                }
+            records_by_raw_key[raw_key] = record
+
+        starts = values[6]
+        starts_count = parsed_counts.get(starts)
+        if starts_count is None:
+            starts_count = parsed_counts[starts] = parse_positions(starts, default=0)
+
+        record['starts'] += starts_count
+        record['records'] += 1
+
+    return list(groups.values())
 
 
 def aggregate_starts_by_provider_year(starts_data: List[Dict[str, Any]],
-                                      most_recent_year: str = None) -> Dict[str, Dict[str, int]]:
+                                      most_recent_year: str = None) -> tuple:
     """
     Aggregate starts data by provider and year, with optional quarterly breakdown for most recent year.
 
+    Each provider's largest annual total is tracked as the totals grow, so callers
+    can classify providers by size without another pass over the aggregated data.
+
     Args:
         starts_data: List of starts data dictionaries
         most_recent_year: The most recent academic year (e.g., '2024-25').
@@ -132,33 +173,38 @@ def aggregate_starts_by_provider_year(starts_data: List[Dict[str, Any]],
                           If None, all years including the most recent will be shown as annual totals.
 
     Returns:
-        Dictionary with provider names as keys and year/quarter->starts dictionaries as values.
+        Tuple of (aggregated, max_annual_starts). aggregated is a dictionary with provider
+        names as keys and year/quarter->starts dictionaries as values.
         If most_recent_year is specified, keys for that year will be like '2024-25 Q1', '2024-25 Q2', etc.
         For other years (or all years if most_recent_year is None), keys will be just the year like '2023-24'.
+        max_annual_starts maps each provider to its largest total for a single
+        non-quarterly key (providers with only quarterly keys are omitted).
     """
-    aggregated = {}
+    # Sum into one flat (provider, year_key) table, then build the per-provider view once
+    totals = defaultdict(int)
+    max_annual_starts = {}
 
     for record in starts_data:
-        provider = record['provider_clean']
         year = record['year']
         quarter = record['quarter']
-        starts = record['starts']
 
-        if provider not in aggregated:
-            aggregated[provider] = {}
+        provider = record['provider_clean']
 
         # For the most recent year, create quarterly keys
         if most_recent_year and year == most_recent_year and quarter > 0:
-            year_key = f"{year} Q{quarter}"
+            totals[(provider, f"{year} Q{quarter}")] += record['starts']
         else:
-            year_key = year
+            key = (provider, year)
+            totals[key] += record['starts']
+            # Starts are never negative, so a running maximum of the totals is exact
+            if totals[key] > max_annual_starts.get(provider, 0):
+                max_annual_starts[provider] = totals[key]
 
-        if year_key not in aggregated[provider]:
-            aggregated[provider][year_key] = 0
-
-        aggregated[provider][year_key] += starts
+    aggregated = {}
+    for (provider, year_key), starts in totals.items():
+        aggregated.setdefault(provider, {})[year_key] = starts
 
-    return aggregated
+    return (aggregated, max_annual_starts)
 
 
 def apply_founders_coders_adjustments(aggregated: Dict[str, Dict[str, int]],
@@ -217,10 +263,11 @@ def prepare_london_sme_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
         starts_data: List of starts data dictionaries
 
     Returns:
-        Tuple of (headers, rows, title)
+        Tuple of (headers, rows, title, bold_rows) where bold_rows is the set of
+        indices of total rows that are emphasised in markdown output
     """
     if not starts_data:
-        return (['Provider', 'No data available'], [], 'Unknown Standard')
+        return (['Provider', 'No data available'], [], 'Unknown Standard', set())
 
     standard_code = starts_data[0].get('standard_code', 'ST0000')
     standard_name = starts_data[0].get('standard_name', 'Unknown Standard')
@@ -231,7 +278,7 @@ def prepare_london_sme_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
     sorted_base_years = sorted(all_base_years)
 
     if not sorted_base_years:
-        return (['Provider', 'No data available'], [], standard_name)
+        return (['Provider', 'No data available'], [], standard_name, set())
 
     most_recent_year = sorted_base_years[-1]
 
@@ -247,7 +294,7 @@ def prepare_london_sme_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
     use_quarterly_breakdown = not has_q4
 
     # Aggregate data by provider and year, with quarterly breakdown for most recent year (if not complete)
-    aggregated = aggregate_starts_by_provider_year(starts_data, year_for_quarterly_breakdown)
+    aggregated, max_annual_starts = aggregate_starts_by_provider_year(starts_data, year_for_quarterly_breakdown)
 
     # Apply FOUNDERS & CODERS adjustments
     aggregated = apply_founders_coders_adjustments(aggregated, use_quarterly_breakdown)
@@ -258,17 +305,10 @@ def prepare_london_sme_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
         all_year_keys.update(provider_data.keys())
 
     # Sort year keys
-    def sort_key(year_key: str) -> tuple:
-        if ' Q' in year_key:
-            year_part, q_part = year_key.split(' Q')
-            return (year_part, int(q_part))
-        else:
-            return (year_key, 0)
-
-    year_keys = sorted(all_year_keys, key=sort_key)
+    year_keys = sorted(all_year_keys, key=split_year_key)
 
     if not year_keys:
-        return (['Provider', 'No data available'], [], standard_name)
+        return (['Provider', 'No data available'], [], standard_name, set())
 
     # Identify quarterly keys for most recent year
     quarterly_keys = [key for key in year_keys if key.startswith(most_recent_year) and ' Q' in key]
@@ -287,99 +327,84 @@ def prepare_london_sme_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
         year_keys = final_year_keys
     # If no quarterly breakdown, year_keys is already correct
 
-    # Separate FOUNDERS & CODERS from other providers
+    # Sort providers into FOUNDERS & CODERS, rogue/closed providers, major providers
+    # (4+ starts in any year) and small providers in a single pass
     fc_name = 'FOUNDERS & CODERS'
-    fc_data = aggregated.pop(fc_name, {})
-
-    # Separate rogue/closed providers
-    rogue_provider_names = ['LONDON COLLEGE OF GLOBAL EDUCATION', 'CITY COLLEGE OF LONDON']
-    rogue_providers = []
-    for rogue_name in rogue_provider_names:
-        if rogue_name in aggregated:
-            rogue_providers.append((rogue_name, aggregated.pop(rogue_name)))
-
-    # Separate major providers (4+ starts in any year) from small providers
+    fc_data = {}
+    rogue_data = {}
     major_providers = []
     small_providers = []
 
     for provider, year_data in aggregated.items():
-        # Check if provider has 4+ starts in any single year (excluding quarterly keys)
-        max_starts = max((starts for key, starts in year_data.items() if ' Q' not in key), default=0)
+        if provider == fc_name:
+            fc_data = year_data
+            continue
+        if provider in ROGUE_PROVIDER_SET:
+            rogue_data[provider] = year_data
+            continue
 
-        if max_starts >= 4:
+        # Check if provider has 4+ starts in any single year (excluding quarterly keys)
+        if max_annual_starts.get(provider, 0) >= 4:
             major_providers.append((provider, year_data))
         else:
             small_providers.append((provider, year_data))
 
+    rogue_providers = [(name, rogue_data[name]) for name in ROGUE_PROVIDER_NAMES if name in rogue_data]
+
     # Sort major providers by most recent year total starts (descending)
     if quarterly_keys:
+        # The most recent year's keys as a set, so each provider key is checked
+        # with one hash lookup instead of a prefix scan
+        recent_year_keys = frozenset(quarterly_keys) | {most_recent_year}
         major_providers.sort(key=lambda x: sum(
             starts for key, starts in x[1].items()
-            if key.startswith(most_recent_year)
+            if key in recent_year_keys
         ), reverse=True)
     else:
         major_providers.sort(key=lambda x: x[1].get(most_recent_year, 0), reverse=True)
 
-    # Calculate totals for each year/quarter key (excluding rogue providers)
-    year_totals = {}
-    for year_key in year_keys:
-        if quarterly_keys and year_key == most_recent_year:
-            # For the total column, sum all quarterly data
-            year_totals[year_key] = sum(
-                provider_data.get(q_key, 0)
-                for q_key in quarterly_keys
-                for _, provider_data in [(fc_name, fc_data)] + major_providers + small_providers
-            )
-        else:
-            year_totals[year_key] = sum(
-                provider_data.get(year_key, 0)
-                for _, provider_data in [(fc_name, fc_data)] + major_providers + small_providers
-            )
-
-    # Calculate "All other providers" totals (small providers)
-    small_totals = {}
-    for year_key in year_keys:
-        if quarterly_keys and year_key == most_recent_year:
-            # For the total column, sum all quarterly data
-            small_totals[year_key] = sum(
-                provider_data.get(q_key, 0)
-                for q_key in quarterly_keys
-                for _, provider_data in small_providers
-            )
-        else:
-            small_totals[year_key] = sum(
-                provider_data.get(year_key, 0)
-                for _, provider_data in small_providers
-            )
+    # Calculate totals for each year/quarter key (excluding rogue providers) in one
+    # pass over the providers, then derive the total column from the quarterly totals
+    year_totals = {year_key: 0 for year_key in year_keys}
+    for _, provider_data in itertools.chain([(fc_name, fc_data)], major_providers, small_providers):
+        for year_key, starts in provider_data.items():
+            year_totals[year_key] = year_totals.get(year_key, 0) + starts
+    if quarterly_keys:
+        year_totals[most_recent_year] = sum(year_totals[q_key] for q_key in quarterly_keys)
+
+    # Calculate "All other providers" totals (small providers) the same way
+    small_totals = {year_key: 0 for year_key in year_keys}
+    for _, provider_data in small_providers:
+        for year_key, starts in provider_data.items():
+            small_totals[year_key] = small_totals.get(year_key, 0) + starts
+    if quarterly_keys:
+        small_totals[most_recent_year] = sum(small_totals[q_key] for q_key in quarterly_keys)
 
     # Build table data
-    headers = ['Provider'] + [format_academic_year(year_key.split(' Q')[0]) +
-                             (f" Q{year_key.split(' Q')[1]}" if ' Q' in year_key else '')
-                             for year_key in year_keys]
+    headers = ['Provider'] + [format_year_key(year_key) for year_key in year_keys]
     rows = []
 
+    # Sum each itemised provider's quarters once for the most recent year's total column
+    quarterly_totals = {
+        provider: sum(year_data.get(q_key, 0) for q_key in quarterly_keys)
+        for provider, year_data in itertools.chain([(fc_name, fc_data)], major_providers, rogue_providers)
+    }
+
+    def build_row_values(provider: str, year_data: Dict[str, int]) -> List[int]:
+        return [
+            quarterly_totals[provider] if quarterly_keys and year_key == most_recent_year
+            else year_data.get(year_key, 0)
+            for year_key in year_keys
+        ]
+
     # FOUNDERS & CODERS first
     if fc_data:
-        row_values = []
-        for year_key in year_keys:
-            if quarterly_keys and year_key == most_recent_year:
-                total_value = sum(fc_data.get(q_key, 0) for q_key in quarterly_keys)
-                row_values.append(total_value)
-            else:
-                row_values.append(fc_data.get(year_key, 0))
-        row = [fc_name] + row_values
+        row = [fc_name] + build_row_values(fc_name, fc_data)
         rows.append(row)
 
     # Major providers (4+ starts in any year, excluding rogue providers)
     for provider, year_data in major_providers:
-        row_values = []
-        for year_key in year_keys:
-            if quarterly_keys and year_key == most_recent_year:
-                total_value = sum(year_data.get(q_key, 0) for q_key in quarterly_keys)
-                row_values.append(total_value)
-            else:
-                row_values.append(year_data.get(year_key, 0))
-        row = [provider] + row_values
+        row = [provider] + build_row_values(provider, year_data)
         rows.append(row)
 
     # All other providers (small providers with <4 starts in all years)
@@ -388,138 +413,54 @@ def prepare_london_sme_table_data(starts_data: List[Dict[str, Any]]) -> tuple:
         rows.append(small_row)
 
     # Total row (after itemized rows, excluding rogue providers)
-    total_row = ['**Total**'] + [f"**{year_totals.get(year_key, 0)}**" for year_key in year_keys]
+    total_row = ['Total'] + [year_totals.get(year_key, 0) for year_key in year_keys]
+    bold_rows = {len(rows)}
     rows.append(total_row)
 
     # Rogue/closed providers at the bottom (excluded from totals)
     for provider, year_data in rogue_providers:
-        row_values = []
-        for year_key in year_keys:
-            if quarterly_keys and year_key == most_recent_year:
-                total_value = sum(year_data.get(q_key, 0) for q_key in quarterly_keys)
-                row_values.append(total_value)
-            else:
-                row_values.append(year_data.get(year_key, 0))
-        row = [f"{provider} (closed)"] + row_values
+        row = [f"{provider} (closed)"] + build_row_values(provider, year_data)
         rows.append(row)
 
-    return (headers, rows, title)
-
-
-def format_london_sme_markdown(starts_data: List[Dict[str, Any]]) -> str:
-    """
-    Format London SME starts data as a markdown table.
-
-    Args:
-        starts_data: List of starts data dictionaries
-
-    Returns:
-        Markdown table formatted string with header
-    """
-    if not starts_data:
-        return "No apprenticeship starts data found for the specified standard."
-
-    headers, rows, title = prepare_london_sme_table_data(starts_data)
-
-    output_lines = []
-    output_lines.append(f"# {title}")
-    output_lines.append("")
-    output_lines.append(TableFormatter.to_markdown(headers, rows))
-
-    return '\n'.join(output_lines)
+    return (headers, rows, title, bold_rows)
 
 
-def format_london_sme_csv(starts_data: List[Dict[str, Any]]) -> str:
+def format_london_sme_output(headers: List[str], rows: List[List[Any]], title: str,
+                             bold_rows: Set[int], output_format: str = 'markdown') -> str:
     """
-    Format London SME starts data as CSV.
+    Format prepared London SME table data in the requested output format.
 
     Args:
-        starts_data: List of starts data dictionaries
+        headers: Table headers from prepare_london_sme_table_data
+        rows: Table rows from prepare_london_sme_table_data
+        title: Table title from prepare_london_sme_table_data
+        bold_rows: Indices of rows to emphasise, from prepare_london_sme_table_data
+        output_format: One of 'markdown', 'console', 'csv' or 'tsv'
 
     Returns:
-        CSV formatted string
-    """
-    headers, rows, _ = prepare_london_sme_table_data(starts_data)
-
-    # Remove markdown bold formatting from CSV output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
-
-    return TableFormatter.to_csv(headers, cleaned_rows)
-
-
-def format_london_sme_table(starts_data: List[Dict[str, Any]]) -> str:
+        Formatted string in the requested format
     """
-    Format London SME starts data as a console-friendly table.
+    if output_format == 'csv':
+        return TableFormatter.to_csv(headers, rows)
+    if output_format == 'tsv':
+        return TableFormatter.to_tsv(headers, rows)
 
-    Args:
-        starts_data: List of starts data dictionaries
-
-    Returns:
-        Formatted table string
-    """
-    if not starts_data:
+    if not rows:
         return "No apprenticeship starts data found for the specified standard."
 
-    headers, rows, title = prepare_london_sme_table_data(starts_data)
-
-    # Remove markdown formatting for console output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
-
-    output_lines = []
-    output_lines.append(title.upper())
-    output_lines.append("=" * 80)
-    output_lines.append("")
-
-    # Calculate column widths
-    column_widths = [CONSOLE_PROVIDER_COLUMN_WIDTH]
-    for _ in range(len(headers) - 1):
-        column_widths.append(CONSOLE_YEAR_COLUMN_WIDTH)
+    if output_format == 'console':
+        column_widths = [CONSOLE_PROVIDER_COLUMN_WIDTH] + [CONSOLE_YEAR_COLUMN_WIDTH] * (len(headers) - 1)
+        table = TableFormatter.to_console_table(headers, rows, column_widths)
+        return f"{title.upper()}\n{'=' * 80}\n\n{table}"
 
-    output_lines.append(TableFormatter.to_console_table(headers, cleaned_rows, column_widths))
-
-    return '\n'.join(output_lines)
-
-
-def format_london_sme_tsv(starts_data: List[Dict[str, Any]]) -> str:
-    """
-    Format London SME starts data as TSV.
-
-    Args:
-        starts_data: List of starts data dictionaries
-
-    Returns:
-        TSV formatted string
-    """
-    headers, rows, _ = prepare_london_sme_table_data(starts_data)
-
-    # Remove markdown formatting
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
-
-    return TableFormatter.to_tsv(headers, cleaned_rows)
+    return f"# {title}\n\n{TableFormatter.to_markdown(headers, rows, bold_rows)}"
 
 
 def main():
     """Main function to run the London SME starts extraction."""
-    # Find the most recent underlying starts file
-    default_file = find_latest_file(UNDERLYING_STARTS_FILE_PATTERN)
-
-    if not default_file:
-        print("Error: No underlying starts data files found in apprenticeships_* folders")
-        print("Please ensure you have downloaded apprenticeship data from the DfE website")
-        sys.exit(1)
-
     # Handle command line arguments
     output_format = 'markdown'  # 'markdown', 'console', 'csv', or 'tsv'
-    csv_file_path = default_file
+    csv_file_path = None
     standard_code = DEFAULT_STANDARD_CODE
 
     # Parse arguments: [options] [standard_code] [input_file]
@@ -529,18 +470,14 @@ def main():
         if arg in ['-h', '--help']:
             print(__doc__)
             return
-        elif arg in ['--csv', '-c']:
-            output_format = 'csv'
-        elif arg in ['--table']:
-            output_format = 'console'
-        elif arg in ['--tsv', '-t']:
-            output_format = 'tsv'
+        elif arg in OUTPUT_FORMAT_FLAGS:
+            output_format = OUTPUT_FORMAT_FLAGS[arg]
         elif not arg.startswith('-'):
             positional_args.append(arg)
 
     # First positional arg is standard code, second is file path
     if len(positional_args) >= 1:
-        if positional_args[0].startswith('ST') and len(positional_args[0]) >= 5:
+        if is_standard_code(positional_args[0]):
             standard_code = positional_args[0]
             if len(positional_args) >= 2:
                 csv_file_path = positional_args[1]
@@ -548,6 +485,15 @@ def main():
             # If first arg doesn't look like a standard code, treat it as a file
             csv_file_path = positional_args[0]
 
+    # Only search for the most recent underlying starts file if none was given
+    if csv_file_path is None:
+        csv_file_path = find_latest_file(UNDERLYING_STARTS_FILE_PATTERN)
+
+        if not csv_file_path:
+            print("Error: No underlying starts data files found in apprenticeships_* folders")
+            print("Please ensure you have downloaded apprenticeship data from the DfE website")
+            sys.exit(1)
+
     try:
         if output_format == 'console':
             print(f"Extracting London SME apprenticeship starts for {standard_code} from: {csv_file_path}")
@@ -558,7 +504,7 @@ def main():
 
         # Display summary
         if output_format == 'console':
-            total_records = len(starts_data)
+            total_records = sum(record['records'] for record in starts_data)
             total_starts = sum(record['starts'] for record in starts_data)
             print(f"Found {total_records} records with {total_starts} total starts for {standard_code}")
             if starts_data:
@@ -566,19 +512,11 @@ def main():
             print(f"Note: FOUNDERS & CODERS includes manual adjustments for employer-provider apprenticeships")
             print()
 
+        # Prepare the table once; every output format renders the same data
+        headers, rows, title, bold_rows = prepare_london_sme_table_data(starts_data)
+
         # Display output in requested format
-        if output_format == 'csv':
-            csv_output = format_london_sme_csv(starts_data)
-            print(csv_output)
-        elif output_format == 'tsv':
-            tsv_output = format_london_sme_tsv(starts_data)
-            print(tsv_output)
-        elif output_format == 'console':
-            table_output = format_london_sme_table(starts_data)
-            print(table_output)
-        else:  # markdown
-            markdown_output = format_london_sme_markdown(starts_data)
-            print(markdown_output)
+        print(format_london_sme_output(headers, rows, title, bold_rows, output_format))
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -31,14 +31,16 @@ Examples:
 """
 
 import sys
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import List, Dict, Any, Set
 
 from utils import (
     parse_positions,
+    is_standard_code,
     find_latest_file,
     format_academic_year,
     TableFormatter,
-    read_csv_data
+    iter_csv_columns
 )
 from config import (
     MONTHLY_STARTS_FILE_PATTERN,
@@ -49,12 +51,16 @@ from config import (
     FIELD_STARTS,
     FIELD_START_MONTH,
     FIELD_STD_FWK_NAME,
+    OUTPUT_FORMAT_FLAGS,
     CONSOLE_MONTH_COLUMN_WIDTH,
     CONSOLE_YEAR_COLUMN_WIDTH
 )
 
+# Row index of each month in the academic year (Aug-Jul) table
+ACADEMIC_MONTH_INDEX = {month: index for index, month in enumerate(ACADEMIC_MONTH_ORDER)}
 
-def extract_monthly_starts(csv_file_path: str, standard_code: str = DEFAULT_STANDARD_CODE) -> List[Dict[str, Any]]:
+
+def extract_monthly_starts(csv_file_path: str, standard_code: str = DEFAULT_STANDARD_CODE) -> tuple:
     """
     Extract monthly apprenticeship starts data for a specific standard.
 
@@ -63,174 +69,207 @@ def extract_monthly_starts(csv_file_path: str, standard_code: str = DEFAULT_STAN
         standard_code: The standard code to filter for (e.g., 'ST0116')
 
     Returns:
-        List of dictionaries containing filtered monthly starts data
+        Tuple of (standard_code, standard_name, monthly_data) where monthly_data is a
+        list of dictionaries, one per distinct (year, month) group. Each record
+        carries the summed 'starts' and the number of CSV rows it represents in
+        'records'. standard_name is empty if no rows matched.
 
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
-        ValueError: If the CSV file has invalid format
+        ValueError: If the CSV file has invalid format or is missing a column
     """
-    def filter_by_standard(row: Dict[str, str]) -> bool:
-        """Filter for specific standard code."""
-        st_code = row.get(FIELD_ST_CODE, '').strip()
-        return st_code == standard_code
-
-    raw_data = read_csv_data(csv_file_path, filter_by_standard)
-
-    # Transform to required format
-    monthly_data = []
-    for row in raw_data:
-        monthly_data.append({
-            'year': row.get(FIELD_YEAR, '').strip(),
-            'start_month': row.get(FIELD_START_MONTH, '').strip(),
-            'starts': parse_positions(row.get(FIELD_STARTS, '').strip(), default=0),
-            'standard_code': row.get(FIELD_ST_CODE, '').strip(),
-            'standard_name': row.get(FIELD_STD_FWK_NAME, '').strip()
-        })
-
-    return monthly_data
-
-
-def aggregate_monthly_data(monthly_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    columns = [
+        FIELD_ST_CODE,
+        FIELD_YEAR,
+        FIELD_START_MONTH,
+        FIELD_STARTS,
+        FIELD_STD_FWK_NAME
+    ]
+
+    # Rows are summed into their (year, month) group as they are streamed, so
+    # memory use is bounded by the number of distinct groups rather than the
+    # number of matching rows
+    groups = {}
+    # Raw year and start month values -> group record, so each key is only
+    # cleaned once
+    records_by_raw_key = {}
+    # Start month cells repeat a dozen or so values, so each distinct raw value
+    # is turned into a month name once
+    month_names = {}
+    # Only the columns used below are read, as plain tuples rather than per-row dicts
+    standard_name = ''
+    for _, raw_year, raw_month, starts, raw_standard_name in iter_csv_columns(
+            csv_file_path, columns, standard_code=standard_code, standard_column=FIELD_ST_CODE):
+        raw_key = (raw_year, raw_month)
+        record = records_by_raw_key.get(raw_key)
+
+        if record is None:
+            year = raw_year.strip()
+            month_name = month_names.get(raw_month)
+            if month_name is None:
+                # Extract month name from start_month (e.g., "01 Aug" or "01-Aug" -> "Aug")
+                start_month = raw_month.strip()
+                if start_month:
+                    # Handle both "01 Aug" and "01-Aug" formats
+                    month_name = start_month.replace('-', ' ').split()[-1]
+                else:
+                    month_name = 'Unknown'
+                month_names[raw_month] = month_name
+
+            key = (year, month_name)
+            record = groups.get(key)
+            if record is None:
+                # Year and month have a handful of distinct values; interning them
+                # shares one string object per value so the (year, month) lookups made
+                # while building the table hit the identity fast path
+                record = groups[key] = {
+                    'year': sys.intern(year),
+                    'month': sys.intern(month_name),
+                    'starts': 0,
+                    'records': 0
+                }
+                # The name is the same on every row of a standard, so take it once
+                if not standard_name:
+                    standard_name = raw_standard_name.strip()
+            records_by_raw_key[raw_key] = record
+
+        # parse_positions strips the value itself
+        record['starts'] += parse_positions(starts, default=0)
+        record['records'] += 1
+
+    return (standard_code, standard_name, list(groups.values()))
+
+
+def aggregate_monthly_data(monthly_data: List[Dict[str, Any]]) -> tuple:
     """
     Aggregate monthly starts data by year and month.
 
+    Each year's total is kept as the months are summed, so the totals row needs
+    no further pass over the aggregated data.
+
     Args:
         monthly_data: List of monthly data dictionaries
 
     Returns:
-        Dictionary with years as keys and month->starts dictionaries as values
+        Tuple of (aggregated, year_totals). aggregated is a dictionary with
+        (year, month) tuples as keys and starts as values. year_totals maps each
+        year to its total starts across all months, including unknown ones.
     """
-    aggregated = {}
+    aggregated = defaultdict(int)
+    year_totals = defaultdict(int)
 
     for record in monthly_data:
         year = record['year']
-        # Extract month name from start_month (e.g., "01 Aug" or "01-Aug" -> "Aug")
-        start_month = record['start_month']
-        if start_month:
-            # Handle both "01 Aug" and "01-Aug" formats
-            month_name = start_month.replace('-', ' ').split()[-1]
-        else:
-            month_name = 'Unknown'
         starts = record['starts']
+        aggregated[(year, record['month'])] += starts
+        year_totals[year] += starts
 
-        if year not in aggregated:
-            aggregated[year] = {}
-
-        if month_name not in aggregated[year]:
-            aggregated[year][month_name] = 0
+    return (dict(aggregated), dict(year_totals))
 
-        aggregated[year][month_name] += starts
 
-    return aggregated
-
-
-def prepare_monthly_table_data(monthly_data: List[Dict[str, Any]]) -> tuple:
+def prepare_monthly_table_data(monthly_data: List[Dict[str, Any]], standard_code: str,
+                               standard_name: str) -> tuple:
     """
     Prepare data for monthly table formatting.
 
     Args:
         monthly_data: List of monthly data dictionaries
+        standard_code: The standard code the data was extracted for
+        standard_name: The standard name from the extracted data
 
     Returns:
-        Tuple of (headers, rows, standard_name)
+        Tuple of (headers, rows, title, bold_rows) where bold_rows is the set of
+        indices of total rows that are emphasised in markdown output
     """
     if not monthly_data:
-        return (['Month', 'No data available'], [], 'Unknown Standard')
+        return (['Month', 'No data available'], [], 'Unknown Standard', set())
 
-    standard_code = monthly_data[0].get('standard_code', 'ST0000')
-    standard_name = monthly_data[0].get('standard_name', 'Unknown Standard')
     title = f"{standard_code} {standard_name} monthly starts"
 
     # Aggregate data by year and month
-    aggregated = aggregate_monthly_data(monthly_data)
+    aggregated, year_totals = aggregate_monthly_data(monthly_data)
 
     # Get all years and sort them
-    years = sorted(aggregated.keys())
+    years = sorted(year_totals)
 
     if not years:
-        return (['Month', 'No data available'], [], title)
+        return (['Month', 'No data available'], [], title, set())
 
     # Build table data
     headers = ['Month'] + [format_academic_year(year) for year in years]
-    rows = []
 
-    # Month rows in academic year order (Aug-Jul)
-    for month in ACADEMIC_MONTH_ORDER:
-        row = [month] + [aggregated[year].get(month, 0) for year in years]
-        rows.append(row)
+    # Month rows in academic year order (Aug-Jul), zero-filled and then
+    # scattered into from the pivot in one pass rather than looked up per cell.
+    # Unknown months have no row but still count towards the year totals.
+    year_columns = {year: column for column, year in enumerate(years, 1)}
+    rows = [[month] + [0] * len(years) for month in ACADEMIC_MONTH_ORDER]
+    for (year, month), starts in aggregated.items():
+        month_index = ACADEMIC_MONTH_INDEX.get(month)
+        if month_index is not None:
+            rows[month_index][year_columns[year]] = starts
 
     # Calculate totals row
-    total_row = ['**Total**'] + [f"**{sum(aggregated[year].values())}**" for year in years]
+    total_row = ['Total'] + [year_totals[year] for year in years]
+    bold_rows = {len(rows)}
     rows.append(total_row)
 
-    return (headers, rows, title)
+    return (headers, rows, title, bold_rows)
 
 
-def format_monthly_markdown(monthly_data: List[Dict[str, Any]]) -> str:
+def format_monthly_markdown(headers: List[str], rows: List[List[Any]], title: str,
+                            bold_rows: Set[int]) -> str:
     """
-    Format monthly data as a markdown table with years as columns and months as rows.
+    Format prepared monthly table data as a markdown table with years as columns and months as rows.
 
     Args:
-        monthly_data: List of monthly data dictionaries
+        headers: Table headers from prepare_monthly_table_data
+        rows: Table rows from prepare_monthly_table_data
+        title: Table title from prepare_monthly_table_data
+        bold_rows: Indices of rows to emphasise, from prepare_monthly_table_data
 
     Returns:
         Markdown table formatted string with header
     """
-    if not monthly_data:
+    if not rows:
         return "No monthly apprenticeship starts data found for the specified standard."
 
-    headers, rows, title = prepare_monthly_table_data(monthly_data)
-
     output_lines = []
     output_lines.append(f"# {title}")
     output_lines.append("")
-    output_lines.append(TableFormatter.to_markdown(headers, rows))
+    output_lines.append(TableFormatter.to_markdown(headers, rows, bold_rows))
 
     return '\n'.join(output_lines)
 
 
-def format_monthly_csv(monthly_data: List[Dict[str, Any]]) -> str:
+def format_monthly_csv(headers: List[str], rows: List[List[Any]]) -> str:
     """
-    Format monthly data as CSV.
+    Format prepared monthly table data as CSV.
 
     Args:
-        monthly_data: List of monthly data dictionaries
+        headers: Table headers from prepare_monthly_table_data
+        rows: Table rows from prepare_monthly_table_data
 
     Returns:
         CSV formatted string
     """
-    headers, rows, _ = prepare_monthly_table_data(monthly_data)
-
-    # Remove markdown formatting
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
-
-    return TableFormatter.to_csv(headers, cleaned_rows)
+    return TableFormatter.to_csv(headers, rows)
 
 
-def format_monthly_table(monthly_data: List[Dict[str, Any]]) -> str:
+def format_monthly_table(headers: List[str], rows: List[List[Any]], title: str) -> str:
     """
-    Format monthly data as a console-friendly table.
+    Format prepared monthly table data as a console-friendly table.
 
     Args:
-        monthly_data: List of monthly data dictionaries
+        headers: Table headers from prepare_monthly_table_data
+        rows: Table rows from prepare_monthly_table_data
+        title: Table title from prepare_monthly_table_data
 
     Returns:
         Formatted table string
     """
-    if not monthly_data:
+    if not rows:
         return "No monthly apprenticeship starts data found for the specified standard."
 
-    headers, rows, title = prepare_monthly_table_data(monthly_data)
-
-    # Remove markdown formatting for console output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
-
     output_lines = []
     output_lines.append(title.upper())
     output_lines.append("=" * 80)
@@ -241,45 +280,30 @@ def format_monthly_table(monthly_data: List[Dict[str, Any]]) -> str:
     for _ in range(len(headers) - 1):
         column_widths.append(CONSOLE_YEAR_COLUMN_WIDTH)
 
-    output_lines.append(TableFormatter.to_console_table(headers, cleaned_rows, column_widths))
+    output_lines.append(TableFormatter.to_console_table(headers, rows, column_widths))
 
     return '\n'.join(output_lines)
 
 
-def format_monthly_tsv(monthly_data: List[Dict[str, Any]]) -> str:
+def format_monthly_tsv(headers: List[str], rows: List[List[Any]]) -> str:
     """
-    Format monthly data as TSV.
+    Format prepared monthly table data as TSV.
 
     Args:
-        monthly_data: List of monthly data dictionaries
+        headers: Table headers from prepare_monthly_table_data
+        rows: Table rows from prepare_monthly_table_data
 
     Returns:
         TSV formatted string
     """
-    headers, rows, _ = prepare_monthly_table_data(monthly_data)
-
-    # Remove markdown formatting
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
-
-    return TableFormatter.to_tsv(headers, cleaned_rows)
+    return TableFormatter.to_tsv(headers, rows)
 
 
 def main():
     """Main function to run the monthly starts extraction."""
-    # Find the most recent monthly starts file
-    default_file = find_latest_file(MONTHLY_STARTS_FILE_PATTERN)
-
-    if not default_file:
-        print("Error: No monthly starts data files found in apprenticeships_* folders")
-        print("Please ensure you have downloaded apprenticeship data from the DfE website")
-        sys.exit(1)
-
     # Handle command line arguments
     output_format = 'markdown'  # 'markdown', 'console', 'csv', or 'tsv'
-    csv_file_path = default_file
+    csv_file_path = None
     standard_code = DEFAULT_STANDARD_CODE
 
     # Parse arguments: [options] [standard_code] [input_file]
@@ -289,18 +313,14 @@ def main():
         if arg in ['-h', '--help']:
             print(__doc__)
             return
-        elif arg in ['--csv', '-c']:
-            output_format = 'csv'
-        elif arg in ['--table']:
-            output_format = 'console'
-        elif arg in ['--tsv', '-t']:
-            output_format = 'tsv'
+        elif arg in OUTPUT_FORMAT_FLAGS:
+            output_format = OUTPUT_FORMAT_FLAGS[arg]
         elif not arg.startswith('-'):
             positional_args.append(arg)
 
     # First positional arg is standard code, second is file path
     if len(positional_args) >= 1:
-        if positional_args[0].startswith('ST') and len(positional_args[0]) >= 5:
+        if is_standard_code(positional_args[0]):
             standard_code = positional_args[0]
             if len(positional_args) >= 2:
                 csv_file_path = positional_args[1]
@@ -308,36 +328,50 @@ def main():
             # If first arg doesn't look like a standard code, treat it as a file
             csv_file_path = positional_args[0]
 
+    # Only search for the most recent monthly starts file if none was given
+    if csv_file_path is None:
+        csv_file_path = find_latest_file(MONTHLY_STARTS_FILE_PATTERN)
+
+        if not csv_file_path:
+            print("Error: No monthly starts data files found in apprenticeships_* folders")
+            print("Please ensure you have downloaded apprenticeship data from the DfE website")
+            sys.exit(1)
+
     try:
         if output_format == 'console':
             print(f"Extracting monthly starts for {standard_code} from: {csv_file_path}")
             print()
 
         # Extract monthly data
-        monthly_data = extract_monthly_starts(csv_file_path, standard_code)
+        standard_code, standard_name, monthly_data = extract_monthly_starts(csv_file_path, standard_code)
+
+        # The summary and table are collected and written to stdout in one call
+        output_parts = []
 
         # Display summary
         if output_format == 'console':
-            total_records = len(monthly_data)
+            total_records = sum(record['records'] for record in monthly_data)
             total_starts = sum(record['starts'] for record in monthly_data)
-            print(f"Found {total_records} records with {total_starts} total starts for {standard_code}")
+            output_parts.append(f"Found {total_records} records with {total_starts} total starts for {standard_code}\n")
             if monthly_data:
-                print(f"Standard: {monthly_data[0]['standard_name']}")
-            print()
+                output_parts.append(f"Standard: {standard_name}\n")
+            output_parts.append("\n")
+
+        # Prepare the table once; every output format renders the same data
+        headers, rows, title, bold_rows = prepare_monthly_table_data(monthly_data, standard_code, standard_name)
 
         # Display output in requested format
         if output_format == 'csv':
-            csv_output = format_monthly_csv(monthly_data)
-            print(csv_output)
+            output_parts.append(format_monthly_csv(headers, rows))
         elif output_format == 'tsv':
-            tsv_output = format_monthly_tsv(monthly_data)
-            print(tsv_output)
+            output_parts.append(format_monthly_tsv(headers, rows))
         elif output_format == 'console':
-            table_output = format_monthly_table(monthly_data)
-            print(table_output)
-        else:  # markdown
-            markdown_output = format_monthly_markdown(monthly_data)
-            print(markdown_output)
+            output_parts.append(format_monthly_table(headers, rows, title))
+        else:
+            output_parts.append(format_monthly_markdown(headers, rows, title, bold_rows))
+        output_parts.append("\n")
+
+        sys.stdout.write(''.join(output_parts))
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -37,7 +37,9 @@ Examples:
     python3 provider.py --csv "MULTIVERSE GROUP"        # MULTIVERSE GROUP, CSV format
 """
 
+import operator
 import sys
+from collections import defaultdict
 from typing import List, Dict, Any
 
 from utils import (
@@ -45,9 +47,10 @@ from utils import (
     parse_positions,
     find_latest_file,
     extract_from_zip_if_needed,
-    format_academic_year,
+    format_year_key,
+    split_year_key,
     TableFormatter,
-    read_csv_data
+    iter_csv_columns
 )
 from config import (
     STARTS_FILE_PATTERN,
@@ -59,6 +62,7 @@ from config import (
     FIELD_STARTS,
     FIELD_START_QUARTER,
     FIELD_STD_FWK_NAME,
+    OUTPUT_FORMAT_FLAGS,
     CONSOLE_YEAR_COLUMN_WIDTH
 )
 
@@ -67,7 +71,7 @@ DEFAULT_PROVIDER = 'FOUNDERS & CODERS'
 CONSOLE_STANDARD_COLUMN_WIDTH = 40
 
 
-def extract_provider_starts(csv_file_path: str, provider_name: str = DEFAULT_PROVIDER) -> List[Dict[str, Any]]:
+def extract_provider_starts(csv_file_path: str, provider_name: str = DEFAULT_PROVIDER) -> tuple:
     """
     Extract apprenticeship starts data for a specific provider.
 
@@ -76,39 +80,87 @@ def extract_provider_starts(csv_file_path: str, provider_name: str = DEFAULT_PRO
         provider_name: The provider name to filter for (e.g., 'FOUNDERS & CODERS')
 
     Returns:
-        List of dictionaries containing filtered starts data
+        Tuple of (provider_display_name, starts_data) where starts_data is a list of
+        dictionaries, one per distinct (standard, year, quarter) group. Each record
+        carries the summed 'starts' and the number of CSV rows it represents in
+        'records'. provider_display_name is the provider name as written on the
+        first matching row, or empty if no rows matched.
 
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
-        ValueError: If the CSV file has invalid format
+        ValueError: If the CSV file has invalid format or is missing a column
     """
     # Clean the target provider name for comparison
     target_provider_clean = clean_provider_name(provider_name)
 
-    def filter_by_provider(row: Dict[str, str]) -> bool:
-        """Filter for specific provider."""
-        provider = row.get(FIELD_PROVIDER_NAME, '').strip()
-        provider_clean = clean_provider_name(provider)
-        return provider_clean == target_provider_clean
-
-    raw_data = read_csv_data(csv_file_path, filter_by_provider)
-
-    # Transform to required format
-    starts_data = []
-    for row in raw_data:
-        quarter_str = row.get(FIELD_START_QUARTER, '').strip()
-        quarter = parse_positions(quarter_str, default=0) if quarter_str else 0
+    # Provider names repeat across many rows, so each distinct raw name is cleaned
+    # and compared once and the result looked up afterwards
+    provider_matches = {}
 
-        starts_data.append({
-            'standard_code': row.get(FIELD_ST_CODE, '').strip(),
-            'standard_name': row.get(FIELD_STD_FWK_NAME, '').strip(),
-            'year': row.get(FIELD_YEAR, '').strip(),
-            'quarter': quarter,
-            'starts': parse_positions(row.get(FIELD_STARTS, '').strip(), default=0),
-            'provider': row.get(FIELD_PROVIDER_NAME, '').strip()
-        })
-
-    return starts_data
+    def filter_by_provider(values: tuple) -> bool:
+        """Filter for specific provider."""
+        provider = values[0]
+        matches = provider_matches.get(provider)
+        if matches is None:
+            provider_clean = clean_provider_name(provider.strip())
+            matches = provider_matches[provider] = provider_clean == target_provider_clean
+        return matches
+
+    columns = [
+        FIELD_PROVIDER_NAME,
+        FIELD_ST_CODE,
+        FIELD_STD_FWK_NAME,
+        FIELD_YEAR,
+        FIELD_START_QUARTER,
+        FIELD_STARTS
+    ]
+
+    # Rows are summed into their group as they are streamed, so memory use is
+    # bounded by the number of distinct groups rather than the size of the file
+    groups = {}
+    provider_display_name = ''
+    # Starts and quarter cells repeat a small set of values, so each distinct raw
+    # value is parsed once and its count looked up afterwards. parse_positions
+    # strips the value itself and gives 0 for blank or non-numeric cells.
+    parsed_counts = {}
+    # Cleaning only trims a provider name, so a matching row's line always contains
+    # the cleaned target name and other lines can be skipped unparsed. A name with
+    # a double quote is escaped in the file, so it gets no pre-filter.
+    line_contains = target_provider_clean if '"' not in target_provider_clean else None
+
+    # Only the columns used below are read, as plain tuples rather than per-row dicts
+    for provider, st_code, standard_name, year, raw_quarter, starts in iter_csv_columns(
+            csv_file_path, columns, filter_by_provider, line_contains=line_contains):
+        quarter = parsed_counts.get(raw_quarter)
+        if quarter is None:
+            quarter = parsed_counts[raw_quarter] = parse_positions(raw_quarter, default=0)
+        starts_count = parsed_counts.get(starts)
+        if starts_count is None:
+            starts_count = parsed_counts[starts] = parse_positions(starts, default=0)
+
+        standard_code = st_code.strip()
+        name = standard_name.strip()
+        year = year.strip()
+
+        key = (standard_code, name, year, quarter)
+        record = groups.get(key)
+        if record is None:
+            record = groups[key] = {
+                'standard_code': standard_code,
+                'standard_name': name,
+                'year': year,
+                'quarter': quarter,
+                'starts': 0,
+                'records': 0
+            }
+
+        record['starts'] += starts_count
+        record['records'] += 1
+        # Every matching row names the same provider, so take it once
+        if not provider_display_name:
+            provider_display_name = provider.strip()
+
+    return (provider_display_name, list(groups.values()))
 
 
 def aggregate_starts_by_standard_year(starts_data: List[Dict[str, Any]],
@@ -127,32 +179,44 @@ def aggregate_starts_by_standard_year(starts_data: List[Dict[str, Any]],
         If most_recent_year is specified, keys for that year will be like '2024-25 Q1', '2024-25 Q2', etc.
         For other years (or all years if most_recent_year is None), keys will be just the year like '2023-24'.
     """
-    aggregated = {}
+    # Sum into one flat (standard, year_key) table, then build the per-standard view once
+    totals = defaultdict(int)
+
+    # Year keys depend only on (year, quarter), so build each one once
+    year_key_cache = {}
+    # Standard keys depend only on (code, name), so build and intern each one once
+    standard_key_cache = {}
 
     for record in starts_data:
-        standard_key = f"{record['standard_code']} {record['standard_name']}"
+        standard_code = record['standard_code']
+        standard_name = record['standard_name']
+        standard_key = standard_key_cache.get((standard_code, standard_name))
+        if standard_key is None:
+            standard_key = standard_key_cache[(standard_code, standard_name)] = sys.intern(
+                f"{standard_code} {standard_name}")
+
         year = record['year']
         quarter = record['quarter']
-        starts = record['starts']
 
-        if standard_key not in aggregated:
-            aggregated[standard_key] = {}
-
-        # For the most recent year, create quarterly keys
-        if most_recent_year and year == most_recent_year and quarter > 0:
-            year_key = f"{year} Q{quarter}"
-        else:
-            year_key = year
+        year_key = year_key_cache.get((year, quarter))
+        if year_key is None:
+            # For the most recent year, create quarterly keys
+            if most_recent_year and year == most_recent_year and quarter > 0:
+                year_key = f"{year} Q{quarter}"
+            else:
+                year_key = year
+            year_key_cache[(year, quarter)] = year_key
 
-        if year_key not in aggregated[standard_key]:
-            aggregated[standard_key][year_key] = 0
+        totals[(standard_key, year_key)] += record['starts']
 
-        aggregated[standard_key][year_key] += starts
+    aggregated = {}
+    for (standard_key, year_key), starts in totals.items():
+        aggregated.setdefault(standard_key, {})[year_key] = starts
 
     return aggregated
 
 
-def prepare_provider_table_data(starts_data: List[Dict[str, Any]],
+def prepare_provider_table_data(starts_data: List[Dict[str, Any]], provider_name: str,
                                  min_starts: int = STARTS_MIN_THRESHOLD) -> tuple:
     """
     Prepare data for provider table formatting with conditional quarterly breakdown for most recent year.
@@ -162,32 +226,29 @@ def prepare_provider_table_data(starts_data: List[Dict[str, Any]],
 
     Args:
         starts_data: List of starts data dictionaries
+        provider_name: Provider name from extract_provider_starts, used in the title
         min_starts: Minimum starts in most recent year to show standard separately (not used, kept for compatibility)
 
     Returns:
-        Tuple of (headers, rows, title)
+        Tuple of (headers, rows, title, bold_rows) where bold_rows is the set of
+        indices of total rows that are emphasised in markdown output
     """
     if not starts_data:
-        return (['Standard', 'No data available'], [], 'Unknown Provider')
+        return (['Standard', 'No data available'], [], 'Unknown Provider', set())
 
-    provider_name = starts_data[0].get('provider', 'Unknown Provider')
     title = f"{provider_name} starts"
 
-    # First, identify the most recent year (without quarters)
-    all_base_years = set(record['year'] for record in starts_data)
-    sorted_base_years = sorted(all_base_years)
-
-    if not sorted_base_years:
-        return (['Standard', 'No data available'], [], title)
-
-    most_recent_year = sorted_base_years[-1]
-
-    # Check if Q4 is present for the most recent year (indicating the year is complete)
-    quarters_in_recent_year = set(
-        record['quarter'] for record in starts_data
-        if record['year'] == most_recent_year and record['quarter'] > 0
-    )
-    has_q4 = 4 in quarters_in_recent_year
+    # Identify the most recent year (without quarters) and whether it has Q4 data
+    # (indicating the year is complete) in a single pass
+    most_recent_year = None
+    has_q4 = False
+    for record in starts_data:
+        year = record['year']
+        if most_recent_year is None or year > most_recent_year:
+            most_recent_year = year
+            has_q4 = record['quarter'] == 4
+        elif year == most_recent_year and record['quarter'] == 4:
+            has_q4 = True
 
     # Only do quarterly breakdown if Q4 is not present
     year_for_quarterly_breakdown = None if has_q4 else most_recent_year
@@ -200,20 +261,11 @@ def prepare_provider_table_data(starts_data: List[Dict[str, Any]],
     for standard_data in aggregated.values():
         all_year_keys.update(standard_data.keys())
 
-    # Sort year keys: regular years first, then quarterly keys
-    def sort_key(year_key: str) -> tuple:
-        if ' Q' in year_key:
-            # Quarterly key like "2024-25 Q1"
-            year_part, q_part = year_key.split(' Q')
-            return (year_part, int(q_part))
-        else:
-            # Regular year like "2023-24"
-            return (year_key, 0)
-
-    year_keys = sorted(all_year_keys, key=sort_key)
+    # Sort year keys: each year's annual key first, then its quarterly keys
+    year_keys = sorted(all_year_keys, key=split_year_key)
 
     if not year_keys:
-        return (['Standard', 'No data available'], [], title)
+        return (['Standard', 'No data available'], [], title, set())
 
     # Identify quarterly keys for most recent year
     quarterly_keys = [key for key in year_keys if key.startswith(most_recent_year) and ' Q' in key]
@@ -234,6 +286,10 @@ def prepare_provider_table_data(starts_data: List[Dict[str, Any]],
         year_keys = final_year_keys
     # If no quarterly breakdown, year_keys is already correct
 
+    # The most recent year's keys as a set, so each standard's keys are checked
+    # with one hash lookup instead of a prefix scan
+    recent_year_keys = frozenset(quarterly_keys) | {most_recent_year}
+
     # Get all standards and sort by most recent year total starts (descending)
     all_standards = []
     for standard, year_data in aggregated.items():
@@ -241,7 +297,7 @@ def prepare_provider_table_data(starts_data: List[Dict[str, Any]],
         if quarterly_keys:
             recent_starts = sum(
                 starts for key, starts in year_data.items()
-                if key.startswith(most_recent_year)
+                if key in recent_year_keys
             )
         else:
             recent_starts = year_data.get(most_recent_year, 0)
@@ -250,53 +306,42 @@ def prepare_provider_table_data(starts_data: List[Dict[str, Any]],
     # Sort all standards by most recent year total starts (descending)
     all_standards.sort(key=lambda x: x[2], reverse=True)
 
-    # Calculate totals for each year/quarter key
-    year_totals = {}
-    for year_key in year_keys:
-        if quarterly_keys and year_key == most_recent_year:
-            # For the total column, sum all quarterly data
-            year_totals[year_key] = sum(
-                standard_data.get(q_key, 0)
-                for q_key in quarterly_keys
-                for _, standard_data, _ in all_standards
-            )
-        else:
-            year_totals[year_key] = sum(
-                standard_data.get(year_key, 0)
-                for _, standard_data, _ in all_standards
-            )
-
     # Build table data
-    headers = ['Standard'] + [format_academic_year(year_key.split(' Q')[0]) + (f" Q{year_key.split(' Q')[1]}" if ' Q' in year_key else '')
-                              for year_key in year_keys]
-    rows = []
-
-    # Total row
-    total_row = ['**Total**'] + [f"**{year_totals.get(year_key, 0)}**" for year_key in year_keys]
-    rows.append(total_row)
+    headers = ['Standard'] + [format_year_key(year_key) for year_key in year_keys]
 
-    # All standards (itemized individually)
+    # All standards (itemized individually), adding each cell into its column
+    # total as the row is built. Totals are kept by column position because
+    # year_keys can name the most recent year twice.
+    column_totals = [0] * len(year_keys)
+    standard_rows = []
     for standard, year_data, _ in all_standards:
-        row_values = []
-        for year_key in year_keys:
-            if quarterly_keys and year_key == most_recent_year:
-                # For the total column, sum all quarterly data for this standard
-                total_value = sum(year_data.get(q_key, 0) for q_key in quarterly_keys)
-                row_values.append(total_value)
-            else:
-                row_values.append(year_data.get(year_key, 0))
-        row = [standard] + row_values
-        rows.append(row)
-
-    return (headers, rows, title)
-
-
-def format_provider_markdown(starts_data: List[Dict[str, Any]], min_starts: int = STARTS_MIN_THRESHOLD) -> str:
+        # For the total column, sum all quarterly data for this standard once,
+        # however many times the column appears
+        quarterly_total = sum(year_data.get(q_key, 0) for q_key in quarterly_keys)
+        row_values = [
+            quarterly_total if quarterly_keys and year_key == most_recent_year
+            else year_data.get(year_key, 0)
+            for year_key in year_keys
+        ]
+        column_totals = list(map(operator.add, column_totals, row_values))
+        standard_rows.append([standard] + row_values)
+
+    # Total row first, then the standards
+    total_row = ['Total'] + column_totals
+    rows = [total_row] + standard_rows
+    bold_rows = {0}
+
+    return (headers, rows, title, bold_rows)
+
+
+def format_provider_markdown(starts_data: List[Dict[str, Any]], provider_name: str,
+                             min_starts: int = STARTS_MIN_THRESHOLD) -> str:
     """
     Format provider data as a markdown table with years as columns and standards as rows.
 
     Args:
         starts_data: List of starts data dictionaries
+        provider_name: Provider name from extract_provider_starts, used in the title
         min_starts: Minimum starts in most recent year to show standard separately
 
     Returns:
@@ -305,44 +350,42 @@ def format_provider_markdown(starts_data: List[Dict[str, Any]], min_starts: int
     if not starts_data:
         return "No apprenticeship starts data found for the specified provider."
 
-    headers, rows, title = prepare_provider_table_data(starts_data, min_starts)
+    headers, rows, title, bold_rows = prepare_provider_table_data(starts_data, provider_name, min_starts)
 
     output_lines = []
     output_lines.append(f"# {title}")
     output_lines.append("")
-    output_lines.append(TableFormatter.to_markdown(headers, rows))
+    output_lines.append(TableFormatter.to_markdown(headers, rows, bold_rows))
 
     return '\n'.join(output_lines)
 
 
-def format_provider_csv(starts_data: List[Dict[str, Any]], min_starts: int = STARTS_MIN_THRESHOLD) -> str:
+def format_provider_csv(starts_data: List[Dict[str, Any]], provider_name: str,
+                        min_starts: int = STARTS_MIN_THRESHOLD) -> str:
     """
     Format provider data as CSV.
 
     Args:
         starts_data: List of starts data dictionaries
+        provider_name: Provider name from extract_provider_starts, used in the title
         min_starts: Minimum starts in most recent year to show standard separately
 
     Returns:
         CSV formatted string
     """
-    headers, rows, _ = prepare_provider_table_data(starts_data, min_starts)
-
-    # Remove markdown bold formatting from CSV output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    headers, rows, _, _ = prepare_provider_table_data(starts_data, provider_name, min_starts)
 
-    return TableFormatter.to_csv(headers, cleaned_rows)
+    return TableFormatter.to_csv(headers, rows)
 
 
-def format_provider_table(starts_data: List[Dict[str, Any]], min_starts: int = STARTS_MIN_THRESHOLD) -> str:
+def format_provider_table(starts_data: List[Dict[str, Any]], provider_name: str,
+                          min_starts: int = STARTS_MIN_THRESHOLD) -> str:
     """
     Format provider data as a console-friendly table.
 
     Args:
         starts_data: List of starts data dictionaries
+        provider_name: Provider name from extract_provider_starts, used in the title
         min_starts: Minimum starts in most recent year to show standard separately
 
     Returns:
@@ -351,13 +394,7 @@ def format_provider_table(starts_data: List[Dict[str, Any]], min_starts: int = S
     if not starts_data:
         return "No apprenticeship starts data found for the specified provider."
 
-    headers, rows, title = prepare_provider_table_data(starts_data, min_starts)
-
-    # Remove markdown formatting for console output
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    headers, rows, title, _ = prepare_provider_table_data(starts_data, provider_name, min_starts)
 
     output_lines = []
     output_lines.append(title.upper())
@@ -369,50 +406,34 @@ def format_provider_table(starts_data: List[Dict[str, Any]], min_starts: int = S
     for _ in range(len(headers) - 1):
         column_widths.append(CONSOLE_YEAR_COLUMN_WIDTH)
 
-    output_lines.append(TableFormatter.to_console_table(headers, cleaned_rows, column_widths))
+    output_lines.append(TableFormatter.to_console_table(headers, rows, column_widths))
 
     return '\n'.join(output_lines)
 
 
-def format_provider_tsv(starts_data: List[Dict[str, Any]], min_starts: int = STARTS_MIN_THRESHOLD) -> str:
+def format_provider_tsv(starts_data: List[Dict[str, Any]], provider_name: str,
+                        min_starts: int = STARTS_MIN_THRESHOLD) -> str:
     """
     Format provider data as TSV.
 
     Args:
         starts_data: List of starts data dictionaries
+        provider_name: Provider name from extract_provider_starts, used in the title
         min_starts: Minimum starts in most recent year to show standard separately
 
     Returns:
         TSV formatted string
     """
-    headers, rows, _ = prepare_provider_table_data(starts_data, min_starts)
-
-    # Remove markdown formatting
-    cleaned_rows = []
-    for row in rows:
-        cleaned_row = [str(cell).replace('**', '') for cell in row]
-        cleaned_rows.append(cleaned_row)
+    headers, rows, _, _ = prepare_provider_table_data(starts_data, provider_name, min_starts)
 
-    return TableFormatter.to_tsv(headers, cleaned_rows)
+    return TableFormatter.to_tsv(headers, rows)
 
 
 def main():
     """Main function to run the provider starts extraction."""
-    # Find the most recent starts file
-    default_file = find_latest_file(STARTS_FILE_PATTERN)
-
-    # If not found, try extracting from zip
-    if not default_file:
-        default_file = extract_from_zip_if_needed(STARTS_ZIP_PATTERN)
-
-    if not default_file:
-        print("Error: No starts data files found in apprenticeships_* folders")
-        print("Please ensure you have downloaded apprenticeship data from the DfE website")
-        sys.exit(1)
-
     # Handle command line arguments
     output_format = 'markdown'  # 'markdown', 'console', 'csv', or 'tsv'
-    csv_file_path = default_file
+    csv_file_path = None
     provider_name = DEFAULT_PROVIDER
 
     # Parse arguments: [options] [provider_name] [input_file]
@@ -422,12 +443,8 @@ def main():
         if arg in ['-h', '--help']:
             print(__doc__)
             return
-        elif arg in ['--csv', '-c']:
-            output_format = 'csv'
-        elif arg in ['--table']:
-            output_format = 'console'
-        elif arg in ['--tsv', '-t']:
-            output_format = 'tsv'
+        elif arg in OUTPUT_FORMAT_FLAGS:
+            output_format = OUTPUT_FORMAT_FLAGS[arg]
         elif not arg.startswith('-'):
             positional_args.append(arg)
 
@@ -441,33 +458,46 @@ def main():
             if len(positional_args) >= 2:
                 csv_file_path = positional_args[1]
 
+    # Only search for (or unzip) the most recent starts file if none was given
+    if csv_file_path is None:
+        csv_file_path = find_latest_file(STARTS_FILE_PATTERN)
+
+        # If not found, try extracting from zip
+        if not csv_file_path:
+            csv_file_path = extract_from_zip_if_needed(STARTS_ZIP_PATTERN)
+
+        if not csv_file_path:
+            print("Error: No starts data files found in apprenticeships_* folders")
+            print("Please ensure you have downloaded apprenticeship data from the DfE website")
+            sys.exit(1)
+
     try:
         if output_format == 'console':
             print(f"Extracting apprenticeship starts for {provider_name} from: {csv_file_path}")
             print()
 
         # Extract starts data
-        starts_data = extract_provider_starts(csv_file_path, provider_name)
+        provider_display_name, starts_data = extract_provider_starts(csv_file_path, provider_name)
 
         # Display summary
         if output_format == 'console':
-            total_records = len(starts_data)
+            total_records = sum(record['records'] for record in starts_data)
             total_starts = sum(record['starts'] for record in starts_data)
             print(f"Found {total_records} records with {total_starts} total starts for {provider_name}")
             print()
 
         # Display output in requested format
         if output_format == 'csv':
-            csv_output = format_provider_csv(starts_data)
+            csv_output = format_provider_csv(starts_data, provider_display_name)
             print(csv_output)
         elif output_format == 'tsv':
-            tsv_output = format_provider_tsv(starts_data)
+            tsv_output = format_provider_tsv(starts_data, provider_display_name)
             print(tsv_output)
         elif output_format == 'console':
-            table_output = format_provider_table(starts_data)
+            table_output = format_provider_table(starts_data, provider_display_name)
             print(table_output)
         else:  # markdown
-            markdown_output = format_provider_markdown(starts_data)
+            markdown_output = format_provider_markdown(starts_data, provider_display_name)
             print(markdown_output)
 
     except FileNotFoundError as e:
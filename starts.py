@@ -43,6 +43,7 @@ from typing import List, Dict, Any
 from utils import (
     clean_provider_name,
     parse_positions,
+    is_standard_code,
     find_latest_file,
     extract_from_zip_if_needed,
     format_academic_year,
@@ -464,7 +465,7 @@ def main():
 
     # First positional arg is standard code, second is file path
     if len(positional_args) >= 1:
-        if positional_args[0].startswith('ST') and len(positional_args[0]) >= 5:
+        if is_standard_code(positional_args[0]):
             standard_code = positional_args[0]
             if len(positional_args) >= 2:
                 csv_file_path = positional_args[1]
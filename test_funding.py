@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for funding module.
+
+Run with: pytest test_funding.py -v
+"""
+
+import os
+import sys
+
+import pytest
+
+import funding
+from funding import (
+    extract_all_funding_starts,
+    extract_funding_starts_cached,
+    get_funding_cache_path
+)
+
+HEADER = 'st_code,funding_type,year,start_quarter,starts,std_fwk_name\n'
+
+
+def write_starts(csv_file, rows):
+    csv_file.write_text(HEADER + ''.join(f'{row}\n' for row in rows))
+
+
+class TestExtractAllFundingStarts:
+    """Tests for extract_all_funding_starts function."""
+
+    def test_sums_one_row_per_standard(self, tmp_path):
+        csv_file = tmp_path / 'starts.csv'
+        write_starts(csv_file, [
+            'ST0116,Supported by ASA levy funds,2023/24,1,5,Software developer',
+            'ST0113,Supported by ASA levy funds,2023/24,1,2,Software tester',
+            ' ST0116 ,Supported by ASA levy funds,2023/24,1,4,Software developer',
+            'ST0418,Other,2022/23,2,7,Data analyst',
+            'ST0116,Supported by ASA levy funds,2023/24,1,1,Software developer',
+            ',Other,2022/23,2,9,Framework',
+        ])
+
+        standards = extract_all_funding_starts(str(csv_file))
+
+        assert sorted(standards) == ['ST0113', 'ST0116', 'ST0418']
+        code, name, starts_data = standards['ST0116']
+        assert (code, name) == ('ST0116', 'Software developer')
+        assert [(record['year'], record['quarter'], record['starts'], record['records'])
+                for record in starts_data] == [('2023/24', 1, 10, 3)]
+        assert [record['starts'] for record in standards['ST0113'][2]] == [2]
+        assert [record['starts'] for record in standards['ST0418'][2]] == [7]
+
+
+class TestMain:
+    """Tests for funding.py argument handling."""
+
+    @pytest.mark.parametrize('args', [['--all', 'ST0113'], ['--all', '--cache']])
+    def test_all_rejects_single_standard_options(self, monkeypatch, capsys, args):
+        monkeypatch.setattr(sys, 'argv', ['funding.py'] + args)
+
+        with pytest.raises(SystemExit) as exit_info:
+            funding.main()
+
+        assert exit_info.value.code == 1
+        assert 'cannot be combined' in capsys.readouterr().out
+
+
+class TestExtractFundingStartsCached:
+    """Tests for extract_funding_starts_cached function."""
+
+    def test_reuses_cached_extract(self, tmp_path):
+        csv_file = tmp_path / 'starts.csv'
+        write_starts(csv_file, ['ST0116,Supported by ASA levy funds,2023/24,1,5,Software developer'])
+        cache_dir = tmp_path / 'cache'
+
+        first = extract_funding_starts_cached(str(csv_file), 'ST0116', str(cache_dir))
+        cache_path = get_funding_cache_path(str(csv_file), 'ST0116', str(cache_dir))
+        assert os.path.exists(cache_path)
+
+        # A cache hit returns the stored extract instead of re-reading the CSV file
+        with open(cache_path, 'w', encoding='utf-8') as cache_file:
+            cache_file.write('["ST0116", "Cached name", []]')
+
+        assert first[1] == 'Software developer'
+        assert extract_funding_starts_cached(str(csv_file), 'ST0116', str(cache_dir)) == (
+            'ST0116', 'Cached name', [])
+
+    def test_malformed_cache_entry_is_a_miss(self, tmp_path):
+        csv_file = tmp_path / 'starts.csv'
+        write_starts(csv_file, ['ST0116,Supported by ASA levy funds,2023/24,1,5,Software developer'])
+        cache_dir = tmp_path / 'cache'
+
+        expected = extract_funding_starts_cached(str(csv_file), 'ST0116', str(cache_dir))
+        cache_path = get_funding_cache_path(str(csv_file), 'ST0116', str(cache_dir))
+
+        for cached in ['["ST0113", "Other", []]',
+                       '["ST0116", "Name", [{"funding_type": "x", "year": "2023/24"}]]',
+                       '{"standard": "ST0116"}']:
+            with open(cache_path, 'w', encoding='utf-8') as cache_file:
+                cache_file.write(cached)
+
+            assert extract_funding_starts_cached(str(csv_file), 'ST0116', str(cache_dir)) == expected
+
+    def test_creates_private_cache_directory(self, tmp_path):
+        csv_file = tmp_path / 'starts.csv'
+        write_starts(csv_file, ['ST0116,Supported by ASA levy funds,2023/24,1,5,Software developer'])
+        cache_dir = tmp_path / 'cache'
+
+        extract_funding_starts_cached(str(csv_file), 'ST0116', str(cache_dir))
+
+        if os.name == 'posix':
+            assert cache_dir.stat().st_mode & 0o077 == 0
+
+    def test_changed_file_invalidates_and_prunes(self, tmp_path):
+        csv_file = tmp_path / 'starts.csv'
+        write_starts(csv_file, ['ST0116,Supported by ASA levy funds,2023/24,1,5,Software developer'])
+        cache_dir = tmp_path / 'cache'
+
+        extract_funding_starts_cached(str(csv_file), 'ST0116', str(cache_dir))
+        old_cache_path = get_funding_cache_path(str(csv_file), 'ST0116', str(cache_dir))
+
+        write_starts(csv_file, ['ST0116,Supported by ASA levy funds,2023/24,1,7,Software developer'])
+        os.utime(csv_file, ns=(1, 1))
+        _, _, starts_data = extract_funding_starts_cached(str(csv_file), 'ST0116', str(cache_dir))
+
+        assert sum(record['starts'] for record in starts_data) == 7
+        assert not os.path.exists(old_cache_path)
+        assert os.listdir(cache_dir) == [
+            os.path.basename(get_funding_cache_path(str(csv_file), 'ST0116', str(cache_dir)))]
@@ -10,8 +10,14 @@ from utils import (
     clean_company_name,
     clean_provider_name,
     parse_positions,
+    is_standard_code,
     format_academic_year,
+    split_year_key,
+    format_year_key,
     extract_year_quarter_from_filename,
+    iter_csv_data,
+    iter_csv_columns,
+    field_equals,
     TableFormatter
 )
 
@@ -97,6 +103,20 @@ class TestParsePositions:
         assert parse_positions("  5  ") == 5
 
 
+class TestIsStandardCode:
+    """Tests for is_standard_code function."""
+
+    def test_accepts_standard_codes(self):
+        assert is_standard_code("ST0116") is True
+        assert is_standard_code("ST10001") is True
+
+    def test_rejects_file_paths_and_malformed_codes(self):
+        assert is_standard_code("data.csv") is False
+        assert is_standard_code("STxyz") is False
+        assert is_standard_code("ST011") is False
+        assert is_standard_code("ST0116.csv") is False
+
+
 class TestFormatAcademicYear:
     """Tests for format_academic_year function."""
 
@@ -113,6 +133,26 @@ class TestFormatAcademicYear:
         assert "2020" in year
 
 
+class TestYearKeys:
+    """Tests for split_year_key and format_year_key functions."""
+
+    def test_splits_quarterly_key(self):
+        assert split_year_key("202425 Q2") == ("202425", 2)
+
+    def test_splits_plain_year(self):
+        assert split_year_key("202324") == ("202324", 0)
+
+    def test_quarterly_keys_sort_after_their_year(self):
+        keys = ["202425 Q2", "202324", "202425 Q1", "202425"]
+        assert sorted(keys, key=split_year_key) == ["202324", "202425", "202425 Q1", "202425 Q2"]
+
+    def test_formats_quarterly_key(self):
+        assert format_year_key("202425 Q3") == "2024-25 Q3"
+
+    def test_formats_plain_year(self):
+        assert format_year_key("202324") == "2023-24"
+
+
 class TestExtractYearQuarter:
     """Tests for extract_year_quarter_from_filename function."""
 
@@ -170,6 +210,16 @@ class TestTableFormatter:
         assert 'Name\tAge' in lines[0]
         assert 'Alice\t30' in lines[1]
 
+    def test_to_csv_and_tsv_accept_iterator(self):
+        headers = ['Name', 'Age']
+        rows = [['Alice', 30], ['Bob', 25]]
+
+        csv_result = TableFormatter.to_csv(headers, (row for row in rows))
+        tsv_result = TableFormatter.to_tsv(headers, iter(rows))
+
+        assert csv_result == TableFormatter.to_csv(headers, rows)
+        assert tsv_result == TableFormatter.to_tsv(headers, rows)
+
     def test_to_markdown_basic(self):
         headers = ['Name', 'Age']
         rows = [['Alice', 30], ['Bob', 25]]
@@ -181,6 +231,15 @@ class TestTableFormatter:
         assert '| Alice | 30 |' in lines[2]
         assert '| Bob | 25 |' in lines[3]
 
+    def test_to_markdown_bold_rows(self):
+        headers = ['Name', 'Age']
+        rows = [['Total', 55], ['Alice', 30]]
+        result = TableFormatter.to_markdown(headers, rows, bold_rows={0})
+
+        lines = result.strip().split('\n')
+        assert '| **Total** | **55** |' in lines[2]
+        assert '| Alice | 30 |' in lines[3]
+
     def test_to_console_table_basic(self):
         headers = ['Name', 'Age']
         rows = [['Alice', 30], ['Bob', 25]]
@@ -233,5 +292,141 @@ class TestTableFormatterEdgeCases:
         assert '100' in result
 
 
+class TestIterCsvData:
+    """Tests for iter_csv_data function."""
+
+    def test_yields_matching_rows(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code,starts\nST0116,3\nST0113,5\nST0116,2\n')
+
+        rows = iter_csv_data(str(csv_file), lambda row: row['st_code'] == 'ST0116')
+
+        assert [row['starts'] for row in rows] == ['3', '2']
+
+    def test_raises_for_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            list(iter_csv_data(str(tmp_path / 'missing.csv'), lambda row: True))
+
+
+class TestFieldEquals:
+    """Tests for field_equals function."""
+
+    def test_matches_raw_and_padded_values(self):
+        assert field_equals("ST0116", "ST0116") is True
+        assert field_equals(" ST0116 ", "ST0116") is True
+
+    def test_rejects_other_values(self):
+        assert field_equals("ST0113", "ST0116") is False
+        assert field_equals("ST01160", "ST0116") is False
+
+
+class TestIterCsvColumns:
+    """Tests for iter_csv_columns function."""
+
+    def test_yields_selected_columns_in_order(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code,year,starts\nST0116,202324,3\nST0113,202425,5\n')
+
+        rows = list(iter_csv_columns(str(csv_file), ['starts', 'st_code']))
+
+        assert rows == [('3', 'ST0116'), ('5', 'ST0113')]
+
+    def test_applies_filter(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code,starts\nST0116,3\nST0113,5\n')
+
+        rows = list(iter_csv_columns(str(csv_file), ['starts'], lambda values: values[0] == '5'))
+
+        assert rows == [('5',)]
+
+    def test_skips_lines_without_text(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code,starts\nST0116,3\nST0113,5\n ST0116 ,2\n')
+
+        rows = list(iter_csv_columns(str(csv_file), ['st_code', 'starts'], line_contains='ST0116'))
+
+        assert rows == [('ST0116', '3'), (' ST0116 ', '2')]
+
+    def test_keeps_records_with_embedded_newlines_whole(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text(
+            'st_code,name,year\n'
+            'ST0116,"Software\ndeveloper",2023/24\n'
+            'ST0113,"Other\nST0116 mention",2022/23\n'
+            'ST0113,Other,2021/22\n'
+            'ST0116,Software developer,2024/25\n'
+        )
+
+        rows = list(iter_csv_columns(str(csv_file), ['st_code', 'name', 'year'],
+                                     line_contains='ST0116'))
+
+        assert rows == [
+            ('ST0116', 'Software\ndeveloper', '2023/24'),
+            ('ST0113', 'Other\nST0116 mention', '2022/23'),
+            ('ST0113', 'Other', '2021/22'),
+            ('ST0116', 'Software developer', '2024/25'),
+        ]
+
+    def test_skips_multiline_record_mentioning_text(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text(
+            'st_code,name,year\n'
+            'ST0113,"Other\nST0116 mention",2022/23\n'
+            'ST0116,Software developer,2024/25\n'
+        )
+
+        rows = list(iter_csv_columns(str(csv_file), ['st_code', 'name', 'year'],
+                                     lambda values: values[0] == 'ST0116',
+                                     line_contains='ST0116'))
+
+        assert rows == [('ST0116', 'Software developer', '2024/25')]
+
+    def test_filters_by_standard_code(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code,starts\nST0116,3\nST0113,5\n ST0116 ,2\nST01160,4\n')
+
+        rows = list(iter_csv_columns(str(csv_file), ['st_code', 'starts'],
+                                     standard_code='ST0116', standard_column='st_code'))
+
+        assert rows == [('ST0116', '3'), (' ST0116 ', '2')]
+
+    def test_filters_by_standard_column_name(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('starts,st_code\n3,ST0116\n5,ST0113\n')
+
+        rows = list(iter_csv_columns(str(csv_file), ['starts'],
+                                     standard_code='ST0116', standard_column='st_code'))
+
+        assert rows == [('3',)]
+
+    def test_standard_code_requires_standard_column(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code,starts\nST0116,3\n')
+
+        with pytest.raises(ValueError, match="standard_column"):
+            list(iter_csv_columns(str(csv_file), ['st_code', 'starts'], standard_code='ST0116'))
+
+    def test_raises_for_missing_standard_column(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('code,starts\nST0116,3\n')
+
+        with pytest.raises(ValueError, match="st_code"):
+            list(iter_csv_columns(str(csv_file), ['starts'],
+                                  standard_code='ST0116', standard_column='st_code'))
+
+    def test_pads_short_rows(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code,starts\nST0116\n')
+
+        assert list(iter_csv_columns(str(csv_file), ['st_code', 'starts'])) == [('ST0116', '')]
+
+    def test_raises_for_missing_column(self, tmp_path):
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('st_code\nST0116\n')
+
+        with pytest.raises(ValueError):
+            list(iter_csv_columns(str(csv_file), ['st_code', 'starts']))
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -7,11 +7,14 @@ analysis scripts, including name cleaning, parsing, and file discovery.
 """
 
 import csv
+import functools
 import glob
+import itertools
+import operator
 import os
 import re
 from io import StringIO
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Set
 
 
 def clean_company_name(name: str) -> str:
@@ -117,6 +120,30 @@ def parse_positions(positions_value: Any, default: int = 1) -> int:
         return default
 
 
+# Standard codes are 'ST' followed by a zero-padded number, e.g. 'ST0116'
+STANDARD_CODE_RE = re.compile(r'ST\d{4,}')
+
+
+def is_standard_code(value: str) -> bool:
+    """
+    Check whether a command line argument looks like an apprenticeship standard code.
+
+    Args:
+        value: The value to check
+
+    Returns:
+        True if the value is a standard code like 'ST0116'
+
+    Examples:
+        >>> is_standard_code("ST0116")
+        True
+        >>> is_standard_code("data.csv")
+        False
+    """
+    return STANDARD_CODE_RE.fullmatch(value) is not None
+
+
+@functools.lru_cache(maxsize=None)
 def format_academic_year(year: str) -> str:
     """
     Format academic year from compact format to readable format.
@@ -143,6 +170,54 @@ def format_academic_year(year: str) -> str:
     return year
 
 
+@functools.lru_cache(maxsize=None)
+def split_year_key(year_key: str) -> tuple:
+    """
+    Split a year/quarter key into its academic year and quarter number.
+
+    Results are cached, as tables only ever contain a few dozen distinct keys
+    but sort and format them repeatedly.
+
+    Args:
+        year_key: Year key like "202425" or quarterly key like "202425 Q2"
+
+    Returns:
+        Tuple of (year, quarter) where quarter is 0 for non-quarterly keys
+
+    Examples:
+        >>> split_year_key("202425 Q2")
+        ('202425', 2)
+        >>> split_year_key("202324")
+        ('202324', 0)
+    """
+    year_part, separator, quarter_part = year_key.partition(' Q')
+    if separator:
+        return (year_part, int(quarter_part))
+    return (year_key, 0)
+
+
+@functools.lru_cache(maxsize=None)
+def format_year_key(year_key: str) -> str:
+    """
+    Format a year/quarter key as a readable column header.
+
+    Args:
+        year_key: Year key like "202425" or quarterly key like "202425 Q2"
+
+    Returns:
+        Formatted header like "2024-25" or "2024-25 Q2"
+
+    Examples:
+        >>> format_year_key("202425 Q2")
+        '2024-25 Q2'
+        >>> format_year_key("202324")
+        '2023-24'
+    """
+    year_part, quarter = split_year_key(year_key)
+    header = format_academic_year(year_part)
+    return f"{header} Q{quarter}" if quarter else header
+
+
 def extract_year_quarter_from_filename(filename: str) -> tuple:
     """
     Extract academic year and quarter from a filename.
@@ -305,13 +380,13 @@ class TableFormatter:
     """
 
     @staticmethod
-    def to_csv(headers: List[str], rows: List[List[Any]]) -> str:
+    def to_csv(headers: List[str], rows: Iterable[List[Any]]) -> str:
         """
         Format data as CSV using Python's csv module.
 
         Args:
             headers: List of column headers
-            rows: List of row data (each row is a list of values)
+            rows: List or iterator of row data (each row is a list of values)
 
         Returns:
             CSV formatted string with proper escaping
@@ -323,13 +398,13 @@ class TableFormatter:
         return output.getvalue()
 
     @staticmethod
-    def to_tsv(headers: List[str], rows: List[List[Any]]) -> str:
+    def to_tsv(headers: List[str], rows: Iterable[List[Any]]) -> str:
         """
         Format data as TSV (tab-separated values).
 
         Args:
             headers: List of column headers
-            rows: List of row data
+            rows: List or iterator of row data
 
         Returns:
             TSV formatted string
@@ -341,13 +416,15 @@ class TableFormatter:
         return output.getvalue()
 
     @staticmethod
-    def to_markdown(headers: List[str], rows: List[List[Any]]) -> str:
+    def to_markdown(headers: List[str], rows: List[List[Any]],
+                    bold_rows: Optional[Set[int]] = None) -> str:
         """
         Format data as Markdown table.
 
         Args:
             headers: List of column headers
             rows: List of row data
+            bold_rows: Optional set of row indices whose cells are rendered in bold
 
         Returns:
             Markdown table formatted string
@@ -363,8 +440,11 @@ class TableFormatter:
         lines.append(separator)
 
         # Data rows
-        for row in rows:
-            row_line = "| " + " | ".join(str(cell) for cell in row) + " |"
+        for i, row in enumerate(rows):
+            if bold_rows and i in bold_rows:
+                row_line = "| " + " | ".join(f"**{cell}**" for cell in row) + " |"
+            else:
+                row_line = "| " + " | ".join(str(cell) for cell in row) + " |"
             lines.append(row_line)
 
         return '\n'.join(lines)
@@ -425,16 +505,19 @@ class TableFormatter:
         return '\n'.join(lines)
 
 
-def read_csv_data(csv_file_path: str, filter_fn: Callable[[Dict[str, str]], bool]) -> List[Dict[str, Any]]:
+def iter_csv_data(csv_file_path: str, filter_fn: Callable[[Dict[str, str]], bool]) -> Iterator[Dict[str, str]]:
     """
-    Read and filter CSV data with proper error handling.
+    Stream and filter CSV rows one at a time with proper error handling.
+
+    Unlike read_csv_data, matching rows are yielded as they are read so callers
+    can transform them without first materializing every raw row in memory.
 
     Args:
         csv_file_path: Path to the CSV file
         filter_fn: Function that returns True for rows to include
 
-    Returns:
-        List of dictionaries containing filtered data
+    Yields:
+        Dictionaries for rows matching the filter
 
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
@@ -443,19 +526,175 @@ def read_csv_data(csv_file_path: str, filter_fn: Callable[[Dict[str, str]], bool
     if not os.path.exists(csv_file_path):
         raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
 
-    filtered_data = []
-
     try:
         with open(csv_file_path, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
 
             for row in reader:
                 if filter_fn(row):
-                    filtered_data.append(row)
+                    yield row
 
     except csv.Error as e:
         raise ValueError(f"Error reading CSV file: {e}")
     except UnicodeDecodeError as e:
         raise ValueError(f"Error decoding CSV file: {e}")
 
-    return filtered_data
+
+def field_equals(value: str, expected: str) -> bool:
+    """
+    Compare a raw CSV field with an expected value, ignoring surrounding whitespace.
+
+    DfE files are rarely padded, so the raw value is compared first and only
+    stripped (allocating a new string) when that misses.
+
+    Args:
+        value: Raw field value as read from the CSV file
+        expected: The stripped value to compare against
+
+    Returns:
+        True if the field equals the expected value once stripped
+
+    Examples:
+        >>> field_equals(" ST0116 ", "ST0116")
+        True
+        >>> field_equals("ST0113", "ST0116")
+        False
+    """
+    return value == expected or value.strip() == expected
+
+
+def _lines_containing(lines: Iterable[str], text: str) -> Iterator[str]:
+    """
+    Yield the lines that contain text, until a record may span several lines.
+
+    A line with an odd number of double quotes opens (or closes) a quoted field
+    that continues on the next line, so from that line on every line is yielded
+    and csv.reader sees the records whole.
+
+    Args:
+        lines: Lines of a CSV file, after the header
+        text: Text that every wanted line must contain
+
+    Yields:
+        Lines to be parsed
+    """
+    lines = iter(lines)
+    for line in lines:
+        if '"' in line and line.count('"') % 2:
+            yield line
+            yield from lines
+            return
+        if text in line:
+            yield line
+
+
+def iter_csv_columns(csv_file_path: str, columns: List[str],
+                     filter_fn: Optional[Callable[[tuple], bool]] = None,
+                     line_contains: Optional[str] = None,
+                     standard_code: Optional[str] = None,
+                     standard_column: Optional[str] = None) -> Iterator[tuple]:
+    """
+    Stream selected columns of a CSV file as tuples with proper error handling.
+
+    Column positions are resolved once from the header row, so each row is read
+    by index instead of being built into a dictionary.
+
+    When line_contains is given, lines that do not contain that text are skipped
+    before they are parsed at all. This is a cheap pre-filter for selective reads
+    (e.g. one provider out of a whole starts file); filter_fn should still
+    check the parsed value. Once a quoted field spans a line break, the rest of
+    the file is parsed in full so no record is split or merged.
+
+    When standard_code is given, only rows whose standard_column equals it (see
+    field_equals) are yielded, and line_contains defaults to the code so lines
+    without it are skipped unparsed.
+
+    Args:
+        csv_file_path: Path to the CSV file
+        columns: Names of the columns to return, in the order they should appear
+        filter_fn: Optional function that returns True for tuples to include
+        line_contains: Optional text that every wanted line must contain
+        standard_code: Optional standard code that standard_column must match
+        standard_column: Name of the column holding the standard code; required
+                         with standard_code and need not be one of columns
+
+    Yields:
+        Tuples of column values for rows matching the filter
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If the CSV file has invalid format or is missing a column
+    """
+    if not os.path.exists(csv_file_path):
+        raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
+
+    if standard_code is not None:
+        if standard_column is None:
+            raise ValueError("standard_column is required when filtering by standard_code")
+        if line_contains is None:
+            line_contains = standard_code
+
+    try:
+        with open(csv_file_path, 'r', encoding='utf-8') as file:
+            lines = file
+            if line_contains is not None:
+                header_line = file.readline()
+                lines = itertools.chain([header_line], _lines_containing(file, line_contains))
+
+            reader = csv.reader(lines)
+            header = next(reader, [])
+
+            positions = {name: i for i, name in enumerate(header)}
+            missing = [column for column in columns if column not in positions]
+            if standard_code is not None and standard_column not in positions:
+                missing.append(standard_column)
+            if missing:
+                raise ValueError(f"CSV file is missing required columns: {', '.join(missing)}")
+
+            indices = [positions[column] for column in columns]
+            if len(indices) == 1:
+                index = indices[0]
+                get_values = lambda row: (row[index],)
+            else:
+                get_values = operator.itemgetter(*indices)
+            standard_index = positions[standard_column] if standard_code is not None else None
+
+            for row in reader:
+                # Skip blank lines, as csv.DictReader does
+                if not row:
+                    continue
+                if standard_index is not None:
+                    st_code = row[standard_index] if standard_index < len(row) else ''
+                    if not field_equals(st_code, standard_code):
+                        continue
+                try:
+                    values = get_values(row)
+                except IndexError:
+                    # Short rows are padded with empty values
+                    values = get_values(row + [''] * (len(header) - len(row)))
+
+                if filter_fn is None or filter_fn(values):
+                    yield values
+
+    except csv.Error as e:
+        raise ValueError(f"Error reading CSV file: {e}")
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Error decoding CSV file: {e}")
+
+
+def read_csv_data(csv_file_path: str, filter_fn: Callable[[Dict[str, str]], bool]) -> List[Dict[str, Any]]:
+    """
+    Read and filter CSV data with proper error handling.
+
+    Args:
+        csv_file_path: Path to the CSV file
+        filter_fn: Function that returns True for rows to include
+
+    Returns:
+        List of dictionaries containing filtered data
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If the CSV file has invalid format
+    """
+    return list(iter_csv_data(csv_file_path, filter_fn))